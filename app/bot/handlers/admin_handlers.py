@@ -86,7 +86,6 @@ def admin_only(func):
 
 
 @admin_only
-@send_typing_action
 async def admin_start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """
     Entry point for administrative interface.
@@ -278,6 +277,7 @@ async def export_data(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int
 
 
 @admin_only
+@send_typing_action(expected_duration_ms=1000)
 async def handle_export_selection(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """
     Handle the export selection and process the data export.
@@ -20,7 +20,6 @@ Enhanced with:
 """
 
 import logging
-import re
 from datetime import datetime
 from typing import Optional, Dict, Any
 
@@ -47,16 +46,15 @@ from app.bot.utils import (
     get_complaint_text_choice_inline_keyboard,
     get_final_submission_inline_keyboard,
     validate_phone_number,
+    EMAIL_REGEX,
     get_residence_status_keyboard,
     get_disability_keyboard,
-    get_governorates_keyboard
+    get_governorates_keyboard,
+    send_typing_action
 )
 
 logger = logging.getLogger(__name__)
 
-# Email validation pattern
-EMAIL_REGEX = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-
 # --- Helper functions ---
 
 def _get_complaint_data(user_id: int, context: ContextTypes.DEFAULT_TYPE) -> ComplaintData:
@@ -205,11 +203,47 @@ async def _generate_complaint_summary(bot_instance: InstitutionBot, complaint_da
     
     return "\n".join(summary_parts)
 
+# Complete ordered sequence of possible data collection steps
+_STEP_SEQUENCE = (
+    'name',
+    'sex',
+    'age',
+    'nationality',
+    'phone',
+    'email',
+    'residence_status',
+    'governorate',
+    'directorate',
+    'village',
+    'disability',
+    'complaint_text'
+)
+
+# (id(fields config), (fields config, {step: next enabled step})); the config
+# reference is kept so a recycled id() can never serve another config's table
+_next_step_tables: Dict[int, tuple] = {}
+
+
+def _build_next_step_table(config) -> Dict[str, str]:
+    """Map every step to the next step enabled in the data collection config."""
+    table = {}
+    next_enabled = 'complaint_text'
+    # Walk the sequence backwards, carrying the nearest enabled step along
+    for step in reversed(_STEP_SEQUENCE):
+        table[step] = next_enabled
+        if getattr(config, step, False):
+            next_enabled = step
+    return table
+
+
 def _get_next_step_after(bot_instance: InstitutionBot, current_step: str) -> str:
     """
     Centralized logic to determine the next step in the data collection flow.
     Follows a predefined sequence and checks which fields are enabled in config.
     
+    The step -> next step table is built once per config, since the enabled
+    fields never change at runtime.
+    
     Args:
         bot_instance: The bot instance containing configuration
         current_step: The name of the current step
@@ -217,41 +251,18 @@ def _get_next_step_after(bot_instance: InstitutionBot, current_step: str) -> str
     Returns:
         str: The name of the next step to proceed to
     """
-    # Define the complete ordered sequence of possible steps
-    step_sequence = [
-        'name',
-        'sex',
-        'age',
-        'nationality',
-        'phone',
-        'email',
-        'residence_status',
-        'governorate',
-        'directorate',
-        'village',
-        'disability',
-        'complaint_text'
-    ]
-    
     # Get the configuration for which fields are enabled
     config = bot_instance.config.application_settings.data_collection_fields
     
-    try:
-        # Find the current step in the sequence
-        current_index = step_sequence.index(current_step)
-        
-        # Iterate through remaining steps to find the next enabled one
-        for next_step in step_sequence[current_index + 1:]:
-            # Check if this step is enabled in config
-            if getattr(config, next_step, False):
-                return next_step
-        
-        # If no enabled steps found after current one, default to complaint_text
-        return 'complaint_text'
+    entry = _next_step_tables.get(id(config))
+    if entry is None or entry[0] is not config:
+        entry = _next_step_tables[id(config)] = (config, _build_next_step_table(config))
     
-    except ValueError:
+    next_step = entry[1].get(current_step)
+    if next_step is None:
         logger.error(f"Unknown current_step in _get_next_step_after: {current_step}")
         return 'complaint_text'
+    return next_step
 
 async def _transition_to_next_step(
     update: Update,
@@ -1049,6 +1060,7 @@ async def process_complaint_text(update: Update, context: ContextTypes.DEFAULT_T
         await update.message.reply_text(get_message('error_generic', bot_instance, is_arabic))
         return states.COLLECTING_COMPLAINT_TEXT
 
+@send_typing_action(expected_duration_ms=3000)
 async def handle_submission_confirmation(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Handles final submission confirmation for standard complaints."""
     bot_instance: InstitutionBot = context.bot_data['bot_instance']
@@ -1297,6 +1309,7 @@ async def process_critical_complaint_text(update: Update, context: ContextTypes.
         await update.message.reply_text(get_message('error_generic', bot_instance, is_arabic))
         return states.CRITICAL_COLLECTING_COMPLAINT_TEXT
 
+@send_typing_action(expected_duration_ms=3000)
 async def handle_critical_submission_confirmation(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Handles final submission for critical complaints with urgency indicators."""
     bot_instance: InstitutionBot = context.bot_data['bot_instance']
@@ -1353,16 +1366,8 @@ async def handle_critical_submission_confirmation(update: Update, context: Conte
                 await cleanup_conversation_state(update, context)
                 return ConversationHandler.END
 
-            # Send critical notifications
-            if hasattr(bot_instance, 'email_service'):
-                notification_email = bot_instance.config.critical_complaint_config.notification_email
-                await bot_instance.email_service.send_critical_complaint_email(
-        data=complaint_data,
-        notification_email=notification_email,
-        analysis_results=analysis_result
-    )
-            else:
-                await bot_instance._send_critical_complaint_email(complaint_data)
+            # Send critical notifications in the background
+            bot_instance._send_critical_complaint_email(complaint_data, analysis_result)
 
             # Notify user with new message
             confirmation_msg = get_message(
@@ -23,6 +23,8 @@ from typing import Dict, Any, Optional
 from telegram import Update
 from telegram.ext import ContextTypes
 
+from app.bot.utils import EMAIL_REGEX
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
@@ -139,9 +141,7 @@ def validate_user_input(
         
         # Type-specific validation
         if input_type == 'email':
-            import re
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            if not re.match(email_pattern, input_text):
+            if not EMAIL_REGEX.match(input_text):
                 return False, "Please enter a valid email address."
         
         elif input_type == 'description':
@@ -71,7 +71,8 @@ from app.bot.institution_bot_logic import InstitutionBot, ComplaintData
 from app.bot.utils import (
     get_message,
     get_user_preferred_language_is_arabic,
-    get_initial_action_buttons_keyboard
+    get_initial_action_buttons_keyboard,
+    send_typing_action
 )
 
 # Import shared utilities from conversation_utils
@@ -156,6 +157,7 @@ async def enhanced_cancel_conversation(update: Update, context: ContextTypes.DEF
 
 # ===== ENTRY POINT HANDLERS =====
 
+@send_typing_action(expected_duration_ms=2000)
 async def handle_initial_text_message(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE
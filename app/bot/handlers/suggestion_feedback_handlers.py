@@ -35,7 +35,8 @@ from app.bot import states
 from app.bot.utils import (
     get_message,
     get_user_preferred_language_is_arabic,
-    get_final_submission_inline_keyboard
+    get_final_submission_inline_keyboard,
+    send_typing_action
 )
 
 logger = logging.getLogger(__name__)
@@ -213,6 +214,7 @@ async def process_suggestion_text(update: Update, context: ContextTypes.DEFAULT_
         await cleanup_conversation_state(update, context, reason="error_in_suggestion_processing")
         return ConversationHandler.END
 
+@send_typing_action(expected_duration_ms=3000)
 async def handle_suggestion_confirmation(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """
     Handles confirmation/cancellation of suggestion submission.
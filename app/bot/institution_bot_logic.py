@@ -10,8 +10,8 @@ serving as the backend brain for the Telegram handlers.
 REFACTORED: Updated to use Pydantic AppConfig model with attribute-style access
 instead of dictionary-style configuration access for improved type safety and code quality.
 
-PERFORMANCE FIX: All db_manager calls now wrapped with asyncio.to_thread() to prevent
-blocking the event loop and enable concurrent request handling.
+PERFORMANCE FIX: All db_manager calls now run in the default thread-pool executor (via _db())
+to prevent blocking the event loop and enable concurrent request handling.
 
 LATEST REFACTOR: Implemented multi-stage AI workflow with new analysis methods and streamlined complaint processing.
 
@@ -27,13 +27,24 @@ import io
 import csv
 import base64
 import sys
-from datetime import datetime
+import sqlite3
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass
-import pytz
+from types import MappingProxyType
+from zoneinfo import ZoneInfo
 import yaml
 
+# Optional C-accelerated JSON parser for LLM responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Telegram libraries
 from telegram import Update
 from telegram.ext import Application, ContextTypes, PicklePersistence
@@ -49,6 +60,126 @@ from app.core.email_service import EmailService
 # Import the Pydantic configuration model and ComplaintData DTO
 from app.config.config_model import AppConfig, ComplaintData
 
+# Whitespace runs collapsed when normalizing complaint text for analysis cache keys
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# SQL statements, defined once so every call reuses the same string and hits
+# sqlite3's prepared-statement cache
+_SQL_SELECT_CLASSIFICATION_KEYS = (
+    "SELECT key_type, key_value, parent_value FROM classification_keys WHERE is_active = 1"
+)
+_SQL_INSERT_BENEFICIARY = """INSERT INTO beneficiaries 
+    (user_telegram_id, name, sex, phone, residence_status, 
+     governorate, directorate, village_area, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+_SQL_INSERT_BENEFICIARY_IF_ABSENT = _SQL_INSERT_BENEFICIARY + "\n    ON CONFLICT(user_telegram_id) DO NOTHING"
+_SQL_INSERT_BENEFICIARY_RETURNING_ID = _SQL_INSERT_BENEFICIARY + "\n    RETURNING id"
+# Profile save: inserts the beneficiary or, if the user already has one, updates
+# only the fields given a non-empty value, atomically
+_SQL_UPSERT_BENEFICIARY_PROFILE = _SQL_INSERT_BENEFICIARY + """
+    ON CONFLICT(user_telegram_id) DO UPDATE SET
+        name = COALESCE(NULLIF(excluded.name, ''), name),
+        sex = COALESCE(NULLIF(excluded.sex, ''), sex),
+        phone = COALESCE(NULLIF(excluded.phone, ''), phone),
+        residence_status = COALESCE(NULLIF(excluded.residence_status, ''), residence_status),
+        governorate = COALESCE(NULLIF(excluded.governorate, ''), governorate),
+        directorate = COALESCE(NULLIF(excluded.directorate, ''), directorate),
+        village_area = COALESCE(NULLIF(excluded.village_area, ''), village_area),
+        updated_at = excluded.updated_at
+    RETURNING id"""
+_SQL_SELECT_BENEFICIARY_PROFILE = (
+    "SELECT name, sex, phone, residence_status, governorate, directorate, village_area "
+    "FROM beneficiaries WHERE user_telegram_id = ?"
+)
+_SQL_SELECT_BENEFICIARY_ID = "SELECT id FROM beneficiaries WHERE user_telegram_id = ?"
+_SQL_SELECT_BENEFICIARY_NAME = "SELECT name FROM beneficiaries WHERE user_telegram_id = ?"
+_SQL_SELECT_ANONYMOUS_BENEFICIARY = (
+    "SELECT id FROM beneficiaries WHERE name = ? AND user_telegram_id IS NULL"
+)
+
+# Complaint INSERT returning the AUTOINCREMENT id; reference_id is derived from
+# that id and set by a follow-up UPDATE in the same transaction
+_SQL_INSERT_COMPLAINT = """INSERT INTO complaints (
+        beneficiary_id,
+        -- Submitter Profile Snapshot
+        submitter_name, submitter_sex, submitter_age, submitter_nationality,
+        submitter_phone, submitter_email, submitter_residence_status,
+        submitter_governorate, submitter_directorate, submitter_village,
+        submitter_disability,
+        -- Complaint & AI Analysis Data
+        sector, original_complaint_text, complaint_summary_en,
+        complaint_type, complaint_category, complaint_sensitivity,
+        is_critical, status, source_channel,
+        -- Timestamps
+        submitted_at, created_at, updated_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    RETURNING id"""
+_SQL_UPDATE_COMPLAINT_REFERENCE_ID = "UPDATE complaints SET reference_id = ? WHERE id = ?"
+_SQL_SELECT_COMPLAINT_HISTORY = """SELECT id, complaint_summary_en, submitted_at, status
+    FROM complaints
+    WHERE beneficiary_id = ?
+    ORDER BY submitted_at DESC"""
+_SQL_SELECT_COMPLAINT_STATS = (
+    "SELECT status, critical_count, complaint_count FROM complaint_stats WHERE complaint_count > 0"
+)
+
+# Telegram users whose beneficiary ID is kept in memory
+_BENEFICIARY_ID_CACHE_SIZE = 10000
+
+# Seconds complaint statistics are reused before querying the database again
+_STATS_CACHE_TTL = 10.0
+
+# Analysis values used when the AI analysis fails; read-only, callers get a copy
+_DEFAULT_ANALYSIS_RESULTS = MappingProxyType({
+    'complaint_category': 'General',
+    'sector': 'Unclassified',
+    'sensitivity': 'Normal',
+    'content_assessment': 'Review Required',
+    'summary': 'AI summary unavailable',
+    'is_critical': False,
+    'complaint_type': 'User Complaint'
+})
+
+# Outermost {...} block, used to recover JSON wrapped in extra LLM text
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+
+def _loads_llm_json(text: str) -> Any:
+    """
+    Parse a JSON document from an LLM response, using orjson when available.
+    
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers handle
+    failures the same way with either parser.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+class _LRUDict(OrderedDict):
+    """
+    Mapping with least-recently-used eviction.
+    
+    Behaves like a dict, but reads and writes mark an entry as recently used and
+    the oldest entries are dropped once more than max_size entries are held.
+    """
+    
+    def __init__(self, max_size: int):
+        super().__init__()
+        self.max_size = max_size
+    
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.max_size:
+            self.popitem(last=False)
+
 
 class InstitutionBot:
     """
@@ -57,10 +188,21 @@ class InstitutionBot:
     comprehensive complaint processing and analysis capabilities.
     
     REFACTORED: Now uses Pydantic AppConfig model for type-safe configuration access.
-    PERFORMANCE FIX: All database operations are now non-blocking using asyncio.to_thread().
+    PERFORMANCE FIX: All database operations are now non-blocking via the _db() executor helper.
     ENHANCED: Robust JSON parsing with regex-based fallback for AI responses.
     """
     
+    # Beneficiary profile columns, in INSERT order, and the ComplaintData attributes they come from
+    _PROFILE_FIELDS = (
+        ('name', 'name'),
+        ('sex', 'sex'),
+        ('phone', 'phone'),
+        ('residence_status', 'residence_status'),
+        ('governorate', 'governorate'),
+        ('directorate', 'directorate'),
+        ('village_area', 'village')
+    )
+    
     def __init__(self, config: AppConfig, ai_handler: AIHandler, 
                  cache_manager: Optional[CacheManager], 
                  prompt_builder: PromptBuilder, telegram_token: str,
@@ -95,11 +237,31 @@ class InstitutionBot:
         self.llm_orchestrator = LLMOrchestrator(self.prompt_builder, self.ai_handler)
         
         # Set timezone using attribute access
-        self.local_tz = pytz.timezone(self.config.institution.timezone)
+        self.local_tz = ZoneInfo(self.config.institution.timezone)
+        
+        # Last rendered local timestamp and the monotonic time it was taken at
+        self._timestamp_cache: Tuple[str, float] = ("", float('-inf'))
         
         # Initialize data structures
-        self.user_data: Dict[int, ComplaintData] = {}
+        # Telegram user ID -> beneficiary ID; a beneficiary's ID never changes
+        self._beneficiary_ids: Dict[int, int] = _LRUDict(_BENEFICIARY_ID_CACHE_SIZE)
         self.complaint_classification_keys: List[Dict] = []
+        self._classification_keys_loaded = False
+        self._classification_keys_lock = asyncio.Lock()
+        
+        # Administrator IDs as a set for O(1) membership checks in is_admin
+        self._admin_ids: frozenset = frozenset(self.config.admin_settings.admin_user_ids)
+        
+        # Background tasks (e.g. notification emails) kept alive until they finish
+        self._background_tasks: set = set()
+        
+        # Shared in-flight statistics query, awaited by concurrent admin callers
+        self._stats_inflight: Optional[asyncio.Future] = None
+        
+        # Last computed statistics and the monotonic time they were taken at; the
+        # version is bumped whenever a complaint is logged to invalidate them
+        self._stats_cache: Tuple[Optional[Dict[str, Any]], float] = (None, float('-inf'))
+        self._stats_version = 0
         
         # Setup logger
         self.logger = logging.getLogger(__name__)
@@ -209,33 +371,84 @@ class InstitutionBot:
             self.logger.error(f"Error setting up application: {e}")
             raise
     
+    async def _db(self, fn, *args):
+        """
+        Run a blocking DatabaseManager call on the database manager's executor.
+        
+        The executor's threads are dedicated to the database (one per pooled reader
+        plus the writer), so queries don't compete with other blocking work for the
+        default executor. Falls back to the default executor before connect().
+        
+        Args:
+            fn: DatabaseManager method to call
+            *args: Positional arguments for the call
+            
+        Returns:
+            Whatever the database call returns
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self.db_manager.executor, fn, *args
+        )
+    
+    async def _db_write(self, fn, *args):
+        """
+        Run a blocking DatabaseManager write via _db() under the manager's write lock.
+        
+        SQLite allows a single writer, so concurrent writes wait here on the event
+        loop rather than blocking executor threads. Reads use _db() directly.
+        
+        Args:
+            fn: DatabaseManager method to call
+            *args: Positional arguments for the call
+            
+        Returns:
+            Whatever the database call returns
+        """
+        async with self.db_manager.write_lock:
+            return await self._db(fn, *args)
+    
     async def initialize_internal_services(self, application=None):
         """Initialize services and load classification keys"""
         await self._load_classification_keys()
     
-    async def _load_classification_keys(self):
-        """Load complaint classification keys from database"""
-        try:
-            # Fetch all active classification keys from database (async)
-            keys_data = await asyncio.to_thread(
-                self.db_manager.fetch_all,
-                "SELECT key_type, key_value, parent_value FROM classification_keys WHERE is_active = 1"
-            )
-            
-            # Convert to list of dictionaries for compatibility
-            self.complaint_classification_keys = []
-            for row in keys_data:
-                self.complaint_classification_keys.append({
-                    'key_type': row[0],
-                    'key_value': row[1],
-                    'parent_value': row[2]
-                })
-            
-            self.logger.info(f"Loaded {len(self.complaint_classification_keys)} classification keys from database")
+    async def _load_classification_keys(self, force: bool = False):
+        """
+        Load complaint classification keys from database.
+        
+        The keys are not modified at runtime, so they are loaded once per process;
+        concurrent callers wait on the same load instead of each querying the
+        database. Pass force=True to reload after the table has been edited.
+        
+        Args:
+            force: Reload even if the keys have already been loaded
+        """
+        if self._classification_keys_loaded and not force:
+            return
+        
+        async with self._classification_keys_lock:
+            # Another caller may have completed the load while we were waiting
+            if self._classification_keys_loaded and not force:
+                return
             
-        except Exception as e:
-            self.logger.error(f"Failed to load classification keys: {e}")
-            self.complaint_classification_keys = []
+            try:
+                # Fetch all active classification keys from database (async)
+                keys_data = await self._db(
+                    self.db_manager.fetch_all,
+                    _SQL_SELECT_CLASSIFICATION_KEYS
+                )
+                
+                # Convert to list of dictionaries for compatibility
+                self.complaint_classification_keys = [
+                    {'key_type': key_type, 'key_value': key_value, 'parent_value': parent_value}
+                    for key_type, key_value, parent_value in keys_data
+                ]
+                
+                self._classification_keys_loaded = True
+                self.logger.info(f"Loaded {len(self.complaint_classification_keys)} classification keys from database")
+                
+            except Exception as e:
+                self.logger.error(f"Failed to load classification keys: {e}")
+                self.complaint_classification_keys = []
     
     async def generate_export_file(self, export_type: str) -> Tuple[Optional[io.BytesIO], Optional[str]]:
         """
@@ -260,20 +473,20 @@ class InstitutionBot:
                     'Status', 'Assigned To', 'Resolution Notes', 'Created At', 'Submitted At', 
                     'Updated At', 'Resolved At', 'Source Channel', 'Internal Notes', 'Follow-up Required'
                 ]
-                data = await asyncio.to_thread(self.db_manager.get_complaints_export_data)
+                data = await self._db(self.db_manager.get_complaints_export_data)
                 
             elif export_type == 'beneficiaries':
                 headers = [
                     'ID', 'User Telegram ID', 'Name', 'Sex', 'Phone', 'Residence Status', 
                     'Governorate', 'Directorate', 'Village/Area', 'Last Seen At', 'Created At', 'Updated At'
                 ]
-                data = await asyncio.to_thread(self.db_manager.get_beneficiaries_export_data)
+                data = await self._db(self.db_manager.get_beneficiaries_export_data)
                 
             elif export_type == 'notes':
                 headers = [
                     'ID', 'Complaint ID', 'Complaint Reference ID', 'Note Text', 'Created By', 'Created At'
                 ]
-                data = await asyncio.to_thread(self.db_manager.get_notes_export_data)
+                data = await self._db(self.db_manager.get_notes_export_data)
                 
             else:
                 self.logger.error(f"Invalid export type requested: {export_type}")
@@ -320,31 +533,17 @@ class InstitutionBot:
             user_first_name: First name from Telegram
         """
         try:
-            # Check if beneficiary already exists (async)
-            existing = await asyncio.to_thread(
-                self.db_manager.fetch_one,
-                "SELECT id, name FROM beneficiaries WHERE user_telegram_id = ?",
-                (user_id,)
-            )
-            if existing:
-                # Update last_seen_at if such field exists (optional)
-                self.logger.info(f"Beneficiary already exists for user {user_id}")
-                # Optionally update last_seen_at timestamp here if field is added to schema
-                return
-            
-            # Create new beneficiary record (async)
+            # Create the beneficiary record in a single idempotent statement (async);
+            # the UNIQUE user_telegram_id makes it a no-op for returning users
             current_timestamp = self._get_current_local_timestamp()
-            await asyncio.to_thread(
+            await self._db_write(
                 self.db_manager.execute_query,
-                """INSERT INTO beneficiaries 
-                   (user_telegram_id, name, sex, phone, residence_status, 
-                    governorate, directorate, village_area, created_at, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                _SQL_INSERT_BENEFICIARY_IF_ABSENT,
                 (user_id, user_first_name, "", "", "", "", "", "", 
                  current_timestamp, current_timestamp)
             )
             
-            self.logger.info(f"Created initial beneficiary record for user {user_id} with name: {user_first_name}")
+            self.logger.info(f"Ensured beneficiary record for user {user_id} with name: {user_first_name}")
             
         except Exception as e:
             self.logger.error(f"Error ensuring beneficiary record for user {user_id}: {e}")
@@ -403,15 +602,15 @@ class InstitutionBot:
             
             # الخطوة 3: (تبقى كما هي) عالج الإجابة
             try:
-                result = json.loads(response.strip())
+                result = _loads_llm_json(response.strip())
                 return result.get("is_relevant", True)
             except json.JSONDecodeError:
                 self.logger.warning("Direct JSON parsing failed in is_name_valid. Searching for embedded JSON.")
-                match = re.search(r'\{.*\}', response, re.DOTALL)
+                match = _JSON_OBJECT_RE.search(response)
                 if match:
                     json_part = match.group(0)
                     try:
-                        result = json.loads(json_part)
+                        result = _loads_llm_json(json_part)
                         return result.get("is_relevant", True)
                     except json.JSONDecodeError as e:
                         self.logger.error(f"Failed to parse extracted JSON in is_name_valid: {e}")
@@ -430,6 +629,10 @@ class InstitutionBot:
         Perform final AI-driven analysis of complaint text.
         Enhanced with robust JSON parsing with regex-based fallback.
         
+        Successful analyses are cached in the CacheManager keyed on the normalized
+        complaint text, so repeated and whitespace/case-variant submissions skip
+        the LLM round-trip entirely.
+        
         Args:
             complaint_text: The complaint text to analyze
             
@@ -437,6 +640,17 @@ class InstitutionBot:
             Dict: Analysis results with complaint categorization and metadata
         """
         try:
+            cache_key = None
+            if self.cache_manager:
+                normalized_text = _WHITESPACE_RE.sub(' ', (complaint_text or '').strip()).lower()
+                cache_key = self.cache_manager.generate_cache_key(
+                    'final_analysis', normalized_text, category='ai_response'
+                )
+                cached_results = await self.cache_manager.get(cache_key)
+                if cached_results:
+                    self.logger.info("Returning cached final complaint analysis")
+                    return dict(cached_results)
+            
             # Generate final analysis prompt (synchronous call)
             prompt = self.prompt_builder.generate_final_analysis_prompt(complaint_text)
             
@@ -446,16 +660,16 @@ class InstitutionBot:
             # Enhanced JSON parsing with fallback mechanism
             try:
                 # First, attempt to parse the entire stripped string directly
-                return json.loads(response.strip())
+                analysis_results = _loads_llm_json(response.strip())
             except json.JSONDecodeError:
                 # If direct parsing fails, search for an embedded JSON object
                 self.logger.warning("Direct JSON parsing failed in final analysis. Searching for embedded JSON.")
-                match = re.search(r'\{.*\}', response, re.DOTALL)
+                match = _JSON_OBJECT_RE.search(response)
                 if match:
                     json_part = match.group(0)
                     try:
                         # Attempt to parse the extracted JSON part
-                        return json.loads(json_part)
+                        analysis_results = _loads_llm_json(json_part)
                     except json.JSONDecodeError as e:
                         self.logger.error(f"Failed to parse extracted JSON in final analysis: {e}")
                         self.logger.debug(f"Extracted part was: {json_part}")
@@ -463,6 +677,12 @@ class InstitutionBot:
                 else:
                     self.logger.error(f"No JSON object found in final analysis response: {response}")
                     return self._get_default_analysis_results()
+            
+            # Only genuine analyses are cached; defaults are recomputed next time
+            if cache_key and isinstance(analysis_results, dict):
+                await self.cache_manager.set(cache_key, analysis_results, category='ai_response')
+            
+            return analysis_results
                 
         except Exception as e:
             self.logger.error(f"Error in perform_final_complaint_analysis: {e}")
@@ -475,19 +695,24 @@ class InstitutionBot:
         Returns:
             Dict: Default analysis values
         """
-        return {
-            'complaint_category': 'General',
-            'sector': 'Unclassified',
-            'sensitivity': 'Normal',
-            'content_assessment': 'Review Required',
-            'summary': 'AI summary unavailable',
-            'is_critical': False,
-            'complaint_type': 'User Complaint'
-        }
+        return dict(_DEFAULT_ANALYSIS_RESULTS)
     
     def _get_current_local_timestamp(self) -> str:
-        """Get current timestamp in local timezone as ISO string"""
-        return datetime.now(self.local_tz).isoformat()
+        """
+        Get current timestamp in local timezone as ISO string.
+        
+        The rendered value is reused for up to one second (measured on the
+        monotonic clock), so bursts of writes don't each pay for the timezone
+        conversion and isoformat().
+        """
+        now = time.monotonic()
+        cached_timestamp, cached_at = self._timestamp_cache
+        if now - cached_at < 1.0:
+            return cached_timestamp
+        
+        timestamp = datetime.now(self.local_tz).isoformat()
+        self._timestamp_cache = (timestamp, now)
+        return timestamp
     
     def _process_telegram_message_timestamp(self, telegram_date: Optional[datetime]) -> str:
         """
@@ -505,14 +730,11 @@ class InstitutionBot:
         
         try:
             if telegram_date.tzinfo is None:
-                # Assume naive datetime is in UTF, then convert to local timezone
-                utc_date = pytz.UTC.localize(telegram_date)
-                local_date = utc_date.astimezone(self.local_tz)
-            else:
-                # Already timezone-aware, convert to local timezone
-                local_date = telegram_date.astimezone(self.local_tz)
+                # Assume naive datetime is in UTC
+                telegram_date = telegram_date.replace(tzinfo=timezone.utc)
             
-            return local_date.isoformat()
+            # Convert via the POSIX timestamp to local timezone
+            return datetime.fromtimestamp(telegram_date.timestamp(), self.local_tz).isoformat()
             
         except Exception as e:
             self.logger.warning(f"Error processing telegram timestamp: {e}, using current time")
@@ -539,24 +761,12 @@ class InstitutionBot:
         # At minimum, we need a name for beneficiary profile
         return bool(data.name and data.name.strip())
     
-    def _prepare_profile_data_for_db(self, data: ComplaintData) -> Dict[str, str]:
-        """Prepare profile data for database insertion, handling missing fields gracefully"""
-        return {
-            'name': data.name.strip() if data.name else '',
-            'sex': data.sex.strip() if data.sex else '',
-            'phone': data.phone.strip() if data.phone else '',
-            'residence_status': data.residence_status.strip() if data.residence_status else '',
-            'governorate': data.governorate.strip() if data.governorate else '',
-            'directorate': data.directorate.strip() if data.directorate else '',
-            'village_area': data.village.strip() if data.village else ''
-        }
-    
     async def _check_existing_beneficiary_profile(self, user_id: int) -> Optional[Dict]:
         """Check if beneficiary exists in the database"""
         try:
-            result = await asyncio.to_thread(
+            result = await self._db(
                 self.db_manager.fetch_one,
-                "SELECT name, sex, phone, residence_status, governorate, directorate, village_area FROM beneficiaries WHERE user_telegram_id = ?",
+                _SQL_SELECT_BENEFICIARY_PROFILE,
                 (user_id,)
             )
             
@@ -577,266 +787,357 @@ class InstitutionBot:
             self.logger.error(f"Error checking existing beneficiary: {e}")
             return None
     
-    async def _save_beneficiary_profile(self, data: ComplaintData) -> bool:
+    async def _prepare_beneficiary_profile_statement(self, data: ComplaintData) -> Optional[Tuple[str, Tuple]]:
         """
-        Save or update beneficiary profile in database.
+        Build the statement that saves or updates the beneficiary profile.
         Handles cases with minimal profile information gracefully.
         Enhanced to handle placeholder names and preserve user_first_name when appropriate.
         
+        The name lookup runs here, ahead of time; the returned upsert ... RETURNING id
+        statement is executed inside the complaint transaction by _log_complaint.
+        
         Args:
             data: ComplaintData object with profile information
             
         Returns:
-            bool: True if successful, False otherwise
+            Tuple[str, Tuple]: (sql, params) yielding the beneficiary ID, or None if
+            the profile cannot be saved
         """
         try:
             # Check if we have minimal required data
             if not self._has_minimal_profile_data(data):
                 self.logger.warning(f"Insufficient profile data for user {data.user_id}, skipping profile save")
-                return False
+                return None
             
             current_timestamp = self._get_current_local_timestamp()
-            profile_data = self._prepare_profile_data_for_db(data)
+            
+            # Stripped profile values in _PROFILE_FIELDS order; missing fields become ''
+            profile_values = [
+                (getattr(data, attr) or '').strip() for _, attr in self._PROFILE_FIELDS
+            ]
             
             # Get anonymous user placeholder from config using attribute access
             anonymous_user_name = self.config.application_settings.placeholders.anonymous_user_name
             
             # Check if the name is empty or matches the placeholder
-            if not profile_data['name'] or profile_data['name'] == anonymous_user_name:
+            if not profile_values[0] or profile_values[0] == anonymous_user_name:
                 # Fetch the user's first_name from the initial beneficiary record (async)
                 try:
-                    result = await asyncio.to_thread(
+                    result = await self._db(
                         self.db_manager.fetch_one,
-                        "SELECT name FROM beneficiaries WHERE user_telegram_id = ?",
+                        _SQL_SELECT_BENEFICIARY_NAME,
                         (data.user_id,)
                     )
                     if result and result[0] and result[0] != anonymous_user_name:
-                        profile_data['name'] = result[0]
-                        self.logger.info(f"Using preserved first_name for user {data.user_id}: {profile_data['name']}")
+                        profile_values[0] = result[0]
+                        self.logger.info(f"Using preserved first_name for user {data.user_id}: {profile_values[0]}")
                 except Exception as e:
                     self.logger.warning(f"Could not retrieve preserved first_name for user {data.user_id}: {e}")
             
-            # Check if beneficiary exists
-            existing = await self._check_existing_beneficiary_profile(data.user_id)
-            
-            if existing:
-                # Update existing beneficiary with only non-empty fields
-                update_fields = []
-                update_values = []
-                
-                for field, value in profile_data.items():
-                    if value:  # Only update non-empty fields
-                        update_fields.append(f"{field} = ?")
-                        update_values.append(value)
-                
-                if update_fields:
-                    update_fields.append("updated_at = ?")
-                    update_values.extend([current_timestamp, data.user_id])
-                    
-                    query = f"UPDATE beneficiaries SET {', '.join(update_fields)} WHERE user_telegram_id = ?"
-                    await asyncio.to_thread(
-                        self.db_manager.execute_query, 
-                        query, 
-                        tuple(update_values)
-                    )
-                    
-            else:
-                # Insert new beneficiary (async)
-                await asyncio.to_thread(
-                    self.db_manager.execute_query,
-                    """INSERT INTO beneficiaries 
-                       (user_telegram_id, name, sex, phone, residence_status, 
-                        governorate, directorate, village_area, created_at, updated_at)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (data.user_id, profile_data['name'], profile_data['sex'], 
-                     profile_data['phone'], profile_data['residence_status'],
-                     profile_data['governorate'], profile_data['directorate'], 
-                     profile_data['village_area'], current_timestamp, current_timestamp)
-                )
-            
-            self.logger.info(f"Beneficiary profile saved for user {data.user_id}")
-            return True
+            # Insert the beneficiary, or update an existing one with only non-empty fields
+            return (
+                _SQL_UPSERT_BENEFICIARY_PROFILE,
+                (data.user_id, *profile_values, current_timestamp, current_timestamp)
+            )
             
         except Exception as e:
-            self.logger.error(f"Error saving beneficiary profile: {e}")
-            return False
+            self.logger.error(f"Error preparing beneficiary profile save: {e}")
+            return None
     
-    async def _get_or_create_anonymous_beneficiary(self) -> Optional[int]:
+    async def _prepare_anonymous_beneficiary(self) -> Tuple[Optional[int], Optional[Tuple[str, Tuple]]]:
         """
-        Get or create an anonymous beneficiary for suggestions/feedback with minimal data.
+        Resolve the anonymous beneficiary used for suggestions/feedback with minimal data.
         Uses centralized configuration for anonymous user name.
         
         Returns:
-            int: beneficiary_id or None if failed
+            Tuple containing:
+            - int: ID of the existing anonymous beneficiary, or None
+            - Tuple[str, Tuple]: (sql, params) creating it and yielding its ID when it
+              does not exist yet, to be executed inside the complaint transaction
+            Both are None if the lookup failed.
         """
         try:
             # Get anonymous user name from config using attribute access
             anonymous_user_name = self.config.application_settings.placeholders.anonymous_user_name
             
             # Check if anonymous beneficiary exists (async)
-            result = await asyncio.to_thread(
+            result = await self._db(
                 self.db_manager.fetch_one,
-                "SELECT id FROM beneficiaries WHERE name = ? AND user_telegram_id IS NULL",
+                _SQL_SELECT_ANONYMOUS_BENEFICIARY,
                 (anonymous_user_name,)
             )
             
             if result:
-                return result[0]
+                return result[0], None
             
-            # Create anonymous beneficiary (async)
+            # Create the anonymous beneficiary and get its ID in the same statement
             current_timestamp = self._get_current_local_timestamp()
-            await asyncio.to_thread(
-                self.db_manager.execute_query,
-                """INSERT INTO beneficiaries 
-                   (user_telegram_id, name, sex, phone, residence_status, 
-                    governorate, directorate, village_area, created_at, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            return None, (
+                _SQL_INSERT_BENEFICIARY_RETURNING_ID,
                 (None, anonymous_user_name, "", "", "", "", "", "", 
                  current_timestamp, current_timestamp)
             )
             
-            # Get the newly created beneficiary ID (async)
-            result = await asyncio.to_thread(
-                self.db_manager.fetch_one,
-                "SELECT id FROM beneficiaries WHERE name = ? AND created_at = ?",
-                (anonymous_user_name, current_timestamp)
-            )
+        except Exception as e:
+            self.logger.error(f"Error resolving anonymous beneficiary: {e}")
+            return None, None
+    
+    def _resolve_anonymous_beneficiary_id(self, cursor: sqlite3.Cursor) -> int:
+        """
+        Find or create the anonymous beneficiary within an open transaction.
+        
+        Args:
+            cursor: Cursor of the open transaction
             
-            if result:
-                self.logger.info("Created anonymous beneficiary for suggestions/feedback")
-                return result[0]
+        Returns:
+            int: ID of the anonymous beneficiary
+        """
+        anonymous_user_name = self.config.application_settings.placeholders.anonymous_user_name
+        
+        row = cursor.execute(_SQL_SELECT_ANONYMOUS_BENEFICIARY, (anonymous_user_name,)).fetchone()
+        if row:
+            return row[0]
+        
+        current_timestamp = self._get_current_local_timestamp()
+        return cursor.execute(
+            _SQL_INSERT_BENEFICIARY_RETURNING_ID,
+            (None, anonymous_user_name, "", "", "", "", "", "", 
+             current_timestamp, current_timestamp)
+        ).fetchone()[0]
+    
+    def _write_complaint_records(
+        self,
+        cursor: sqlite3.Cursor,
+        beneficiary_id: Optional[int],
+        beneficiary_statement: Optional[Tuple[str, Tuple]],
+        complaint_values: Tuple
+    ) -> Tuple[str, Optional[int]]:
+        """
+        Write the beneficiary and complaint rows for one submission.
+        
+        Runs inside DatabaseManager.run_in_transaction, so the beneficiary upsert
+        and the complaint insert commit together. A failed beneficiary write is
+        rolled back to a savepoint and the complaint is logged under the anonymous
+        beneficiary instead, so it is never lost.
+        
+        Args:
+            cursor: Cursor of the open transaction
+            beneficiary_id: Known beneficiary ID, used when there is no statement
+            beneficiary_statement: Optional (sql, params) yielding the beneficiary ID
+            complaint_values: Complaint column values following beneficiary_id
             
-            return None
+        Returns:
+            Tuple containing:
+            - str: The generated reference ID
+            - int: The beneficiary ID yielded by beneficiary_statement (or the given
+              beneficiary_id), or None if the anonymous beneficiary was used instead
             
-        except Exception as e:
-            self.logger.error(f"Error creating anonymous beneficiary: {e}")
-            return None
+        Raises:
+            sqlite3.Error: If the complaint write fails (the transaction is rolled back)
+        """
+        complaint_beneficiary_id = beneficiary_id
+        if beneficiary_statement:
+            cursor.execute("SAVEPOINT beneficiary_write")
+            try:
+                row = cursor.execute(*beneficiary_statement).fetchone()
+            except sqlite3.Error as e:
+                self.logger.error(f"Error writing beneficiary, using anonymous beneficiary: {e}")
+                cursor.execute("ROLLBACK TO beneficiary_write")
+                row = None
+            cursor.execute("RELEASE beneficiary_write")
+            
+            if row:
+                beneficiary_id = complaint_beneficiary_id = row[0]
+            else:
+                beneficiary_id = None
+                complaint_beneficiary_id = self._resolve_anonymous_beneficiary_id(cursor)
+        
+        numeric_id = cursor.execute(
+            _SQL_INSERT_COMPLAINT,
+            (complaint_beneficiary_id, *complaint_values)
+        ).fetchone()[0]
+        
+        # Derive the reference ID from the id SQLite assigned
+        prefix = self.config.application_settings.complaint_id_prefix
+        reference_id = f"{prefix}-{numeric_id}" if prefix else str(numeric_id)
+        cursor.execute(_SQL_UPDATE_COMPLAINT_REFERENCE_ID, (reference_id, numeric_id))
+        return reference_id, beneficiary_id
     
     async def _log_complaint(self, data: ComplaintData) -> Optional[str]:
         """
         Log complaint to database with full processing using new AI workflow.
         Handles both full complaints and simple suggestions/feedback.
         
+        All writes for the submission (beneficiary profile, complaint row and its
+        reference ID) are committed in a single transaction.
+        
         Args:
             data: ComplaintData object with complaint information
             
         Returns:
             str: The generated reference ID if successful, None otherwise
         """
+        analysis_task = None
         try:
-            # Determine beneficiary ID based on available data
+            # Step 1: Start the final complaint analysis (new AI workflow) so the LLM
+            # round-trip overlaps with the beneficiary lookups below
+            analysis_task = asyncio.create_task(
+                self.perform_final_complaint_analysis(data.original_complaint_text)
+            )
+            
+            # Step 2: Determine how to resolve the beneficiary based on available data
             beneficiary_id = None
+            beneficiary_statement = None
+            is_user_beneficiary = False
             
             if self._has_minimal_profile_data(data):
-                # Save/update full beneficiary profile
-                profile_saved = await self._save_beneficiary_profile(data)
-                if profile_saved:
-                    beneficiary_result = await asyncio.to_thread(
-                        self.db_manager.fetch_one,
-                        "SELECT id FROM beneficiaries WHERE user_telegram_id = ?",
-                        (data.user_id,)
-                    )
-                    if beneficiary_result:
-                        beneficiary_id = beneficiary_result[0]
+                # Save/update full beneficiary profile within the complaint transaction
+                beneficiary_statement = await self._prepare_beneficiary_profile_statement(data)
+                is_user_beneficiary = beneficiary_statement is not None
             
-            # If no beneficiary_id found, use anonymous beneficiary for suggestions/feedback
-            if not beneficiary_id:
+            # Without a profile to save, use anonymous beneficiary for suggestions/feedback
+            if not beneficiary_statement:
                 self.logger.info(f"Using anonymous beneficiary for user {data.user_id} submission")
-                beneficiary_id = await self._get_or_create_anonymous_beneficiary()
+                beneficiary_id, beneficiary_statement = await self._prepare_anonymous_beneficiary()
                 
-                if not beneficiary_id:
+                if not beneficiary_id and not beneficiary_statement:
                     self.logger.error("Could not create or find anonymous beneficiary")
+                    analysis_task.cancel()
                     return None
             
-            # Step 1: Perform final complaint analysis using new AI workflow
-            analysis_results = await self.perform_final_complaint_analysis(data.original_complaint_text)
+            # Convert the message timestamp while the analysis is still running
+            submitted_at = self._process_telegram_message_timestamp(data.telegram_message_date)
+            
+            analysis_results = await analysis_task
             
-            # Handle timestamps with improved processing
+            # Row timestamps are taken once the analysis is done, before the write
+            # lock is acquired; created_at and updated_at share the same value
             current_timestamp = self._get_current_local_timestamp()
-            submitted_at = self._process_telegram_message_timestamp(data.telegram_message_date)
             
-            # Step 3: Insert complaint into database using analysis results
-            await asyncio.to_thread(
-                self.db_manager.execute_query,
-                """INSERT INTO complaints (
-                    beneficiary_id, reference_id,
-                    -- Submitter Profile Snapshot
-                    submitter_name, submitter_sex, submitter_age, submitter_nationality,
-                    submitter_phone, submitter_email, submitter_residence_status,
-                    submitter_governorate, submitter_directorate, submitter_village,
-                    submitter_disability,
-                    -- Complaint & AI Analysis Data
-                    sector, original_complaint_text, complaint_summary_en,
-                    complaint_type, complaint_category, complaint_sensitivity,
-                    is_critical, status, source_channel,
-                    -- Timestamps
-                    submitted_at, created_at, updated_at
-                   ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    beneficiary_id,
-                    "TBD",  # Placeholder, will be updated later
-                    # Submitter Profile Snapshot Values
-                    data.name,
-                    data.sex,
-                    data.age,
-                    data.nationality,
-                    data.phone,
-                    data.email,
-                    data.residence_status,
-                    data.governorate,
-                    data.directorate,
-                    data.village,
-                    data.disability,
-                    # Complaint & AI Analysis Values
-                    analysis_results.get('sector', ''), # Assuming AI might provide a 'sector'
-                    data.original_complaint_text,
-                    analysis_results.get('summary', ''),
-                    analysis_results.get('complaint_type', 'User Complaint'),
-                    analysis_results.get('complaint_category', 'General'),
-                    analysis_results.get('sensitivity', 'Normal'),
-                    int(analysis_results.get('is_critical', False)),
-                    "PENDING",
-                    "TELEGRAM",
-                    # Timestamp Values
-                    submitted_at,
-                    current_timestamp,
-                    current_timestamp
-                )
+            complaint_values = (
+                # Submitter Profile Snapshot Values
+                data.name,
+                data.sex,
+                data.age,
+                data.nationality,
+                data.phone,
+                data.email,
+                data.residence_status,
+                data.governorate,
+                data.directorate,
+                data.village,
+                data.disability,
+                # Complaint & AI Analysis Values
+                analysis_results.get('sector', ''), # Assuming AI might provide a 'sector'
+                data.original_complaint_text,
+                analysis_results.get('summary', ''),
+                analysis_results.get('complaint_type', 'User Complaint'),
+                analysis_results.get('complaint_category', 'General'),
+                analysis_results.get('sensitivity', 'Normal'),
+                int(analysis_results.get('is_critical', False)),
+                "PENDING",
+                "TELEGRAM",
+                # Timestamp Values
+                submitted_at,
+                current_timestamp,
+                current_timestamp
             )
             
-            # Get the auto-incremented ID (async)
-            numeric_id_result = await asyncio.to_thread(
-                self.db_manager.fetch_one, 
-                "SELECT last_insert_rowid()"
+            # Step 3: Write beneficiary and complaint in one transaction (async)
+            reference_id, beneficiary_id = await self._db_write(
+                self.db_manager.run_in_transaction,
+                self._write_complaint_records,
+                beneficiary_id,
+                beneficiary_statement,
+                complaint_values
             )
-            if not numeric_id_result:
-                self.logger.error("Failed to retrieve new complaint ID after insertion")
-                return None
-            numeric_id = numeric_id_result[0]
             
-            # Generate the reference ID
-            prefix = self.config.application_settings.complaint_id_prefix
-            reference_id = f"{prefix}-{numeric_id}" if prefix else str(numeric_id)
+            # Step 4: Send critical complaint notification using is_critical flag from analysis
+            # (sent in the background so the user's confirmation doesn't wait on SMTP)
+            if analysis_results.get('is_critical', False):
+                self._send_critical_complaint_email(data, analysis_results)
             
-            # Save the reference ID back to the database (async)
-            await asyncio.to_thread(
-                self.db_manager.execute_query,
-                "UPDATE complaints SET reference_id = ? WHERE id = ?",
-                (reference_id, numeric_id)
-            )
+            if is_user_beneficiary and beneficiary_id is not None:
+                self._beneficiary_ids[data.user_id] = beneficiary_id
             
-            # Step 4: Send critical complaint notification using is_critical flag from analysis
-            if analysis_results.get('is_critical', False) and self.email_service:
-                notification_email = self.config.critical_complaint_config.notification_email
-                await self.email_service.send_critical_complaint_email(data, notification_email, analysis_results)
+            # Invalidate cached statistics
+            self._stats_version += 1
+            self._stats_cache = (None, float('-inf'))
             
             self.logger.info(f"Complaint logged for user {data.user_id} with reference ID: {reference_id}")
             return reference_id
             
         except Exception as e:
             self.logger.error(f"Error logging complaint: {e}")
+            if analysis_task and not analysis_task.done():
+                analysis_task.cancel()
             return None
     
+    def _send_critical_complaint_email(
+        self, data: ComplaintData, analysis_results: Optional[Dict] = None
+    ) -> Optional[asyncio.Task]:
+        """
+        Schedule the critical complaint notification email as a background task.
+        
+        The email is sent off the request path; failures are logged when the task
+        completes.
+        
+        Args:
+            data: ComplaintData object for the critical complaint
+            analysis_results: Optional AI analysis results to include in the email
+            
+        Returns:
+            asyncio.Task: The scheduled send, or None if no email service is configured
+        """
+        if not self.email_service:
+            return None
+        
+        notification_email = self.config.critical_complaint_config.notification_email
+        task = asyncio.create_task(
+            self.email_service.send_critical_complaint_email(data, notification_email, analysis_results)
+        )
+        # Keep a strong reference until the task finishes
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_email_task_done)
+        return task
+    
+    def _on_email_task_done(self, task: asyncio.Task) -> None:
+        """Release a finished notification task and log its failure, if any."""
+        self._background_tasks.discard(task)
+        if task.cancelled():
+            return
+        
+        error = task.exception()
+        if error:
+            self.logger.error(f"Critical complaint email task failed: {error}")
+        elif not task.result():
+            self.logger.warning("Critical complaint email could not be sent")
+    
+    async def _get_beneficiary_id(self, user_id: int) -> Optional[int]:
+        """
+        Resolve the beneficiary ID for a Telegram user, cached per user.
+        
+        Args:
+            user_id: Telegram user ID
+            
+        Returns:
+            int: Beneficiary ID, or None if the user has no beneficiary record
+        """
+        beneficiary_id = self._beneficiary_ids.get(user_id)
+        if beneficiary_id is not None:
+            return beneficiary_id
+        
+        result = await self._db(
+            self.db_manager.fetch_one,
+            _SQL_SELECT_BENEFICIARY_ID,
+            (user_id,)
+        )
+        if not result:
+            return None
+        
+        self._beneficiary_ids[user_id] = result[0]
+        return result[0]
+    
     async def get_user_previous_complaints_summary(self, user_id: int) -> List[Dict[str, Any]]:
         """
         Get summary of user's previous complaints from database.
@@ -848,36 +1149,34 @@ class InstitutionBot:
             List of dictionaries containing complaint summaries
         """
         try:
-            # Query to join complaints with beneficiaries table (async)
-            query = """
-            SELECT c.id, c.complaint_summary_en, c.submitted_at, c.status
-            FROM complaints c
-            JOIN beneficiaries b ON c.beneficiary_id = b.id
-            WHERE b.user_telegram_id = ?
-            ORDER BY c.submitted_at DESC
-            """
-            
-            complaints = await asyncio.to_thread(
+            beneficiary_id = await self._get_beneficiary_id(user_id)
+            if beneficiary_id is None:
+                self.logger.info(f"Retrieved 0 previous complaints for user {user_id}")
+                return []
+            
+            # Query the user's complaints directly by beneficiary ID (async)
+            complaints = await self._db(
                 self.db_manager.fetch_all,
-                query,
-                (user_id,)
+                _SQL_SELECT_COMPLAINT_HISTORY,
+                (beneficiary_id,)
             )
             
             # Convert to list of dictionaries
-            result = []
-            for complaint in complaints:
-                result.append({
-                    'id': complaint[0],
-                    'summary': complaint[1] or "No summary available",
-                    'date': complaint[2],
-                    'status': complaint[3] or "UNKNOWN"
-                })
+            result = [
+                {
+                    'id': complaint_id,
+                    'summary': summary or "No summary available",
+                    'date': submitted_at,
+                    'status': status or "UNKNOWN"
+                }
+                for complaint_id, summary, submitted_at, status in complaints
+            ]
             
             self.logger.info(f"Retrieved {len(result)} previous complaints for user {user_id}")
             return result
             
         except Exception as e:
-            self.logger.error(f"Error fetching previous complaints for user {user_id}: {e}")
+            self.logger.exception(f"Error fetching previous complaints for user {user_id}: {e}")
             return []
     
     async def log_complaint_reminder_note(
@@ -901,11 +1200,11 @@ class InstitutionBot:
             note_text = f"User requested a reminder for this complaint. Original details: {retrieved_complaint_details.get('summary', 'No summary available')}"
             created_by = f"USER:{user_id}"
             
-            success = await asyncio.to_thread(
+            success = await self._db_write(
                 self.db_manager.add_complaint_note,
-                complaint_id=original_complaint_id,
-                note_text=note_text,
-                created_by=created_by
+                original_complaint_id,
+                note_text,
+                created_by
             )
             
             if success:
@@ -914,7 +1213,7 @@ class InstitutionBot:
             return False
             
         except Exception as e:
-            self.logger.error(f"Error logging complaint reminder note: {e}")
+            self.logger.exception(f"Error logging complaint reminder note: {e}")
             return False
     
     def is_admin(self, user_id: int) -> bool:
@@ -927,17 +1226,39 @@ class InstitutionBot:
         Returns:
             bool: True if user is admin, False otherwise
         """
-        try:
-            admin_ids = self.config.admin_settings.admin_user_ids
-            return user_id in admin_ids
-        except Exception as e:
-            self.logger.error(f"Error checking admin status for user {user_id}: {e}")
-            return False
+        return user_id in self._admin_ids
     
     async def get_complaint_statistics(self) -> Dict[str, Any]:
         """
         Retrieve and compile key complaint statistics from the database.
         
+        Results are reused for up to _STATS_CACHE_TTL seconds (or until a new
+        complaint is logged), and concurrent callers are coalesced onto a single
+        in-flight query so that a burst of admin requests only hits the database once.
+        
+        Returns:
+            Dictionary containing complaint statistics (see _query_complaint_statistics)
+        """
+        cached_stats, cached_at = self._stats_cache
+        if cached_stats is not None and time.monotonic() - cached_at < _STATS_CACHE_TTL:
+            return cached_stats
+        
+        if self._stats_inflight is None:
+            self._stats_inflight = asyncio.ensure_future(self._query_complaint_statistics())
+            self._stats_inflight.add_done_callback(self._clear_stats_inflight)
+        
+        # Shield the shared query so one cancelled caller doesn't cancel it for the rest
+        return await asyncio.shield(self._stats_inflight)
+    
+    def _clear_stats_inflight(self, future: asyncio.Future) -> None:
+        """Release the completed in-flight statistics query."""
+        if self._stats_inflight is future:
+            self._stats_inflight = None
+    
+    async def _query_complaint_statistics(self) -> Dict[str, Any]:
+        """
+        Run the complaint statistics query against the database.
+        
         Returns:
             Dictionary containing complaint statistics with structure:
             {
@@ -946,6 +1267,7 @@ class InstitutionBot:
                 'status_counts': Dict[str, int]
             }
         """
+        version = self._stats_version
         try:
             stats = {
                 'total_complaints': 0,
@@ -953,35 +1275,25 @@ class InstitutionBot:
                 'status_counts': {}
             }
             
-            # Get total complaints count (async)
-            total_result = await asyncio.to_thread(
-                self.db_manager.fetch_one,
-                "SELECT COUNT(*) FROM complaints"
-            )
-            if total_result:
-                stats['total_complaints'] = total_result[0]
-            
-            # Get critical complaints count (async)
-            critical_result = await asyncio.to_thread(
-                self.db_manager.fetch_one,
-                "SELECT COUNT(*) FROM complaints WHERE is_critical = 1"
-            )
-            if critical_result:
-                stats['critical_complaints'] = critical_result[0]
-            
-            # Get status counts (async)
-            status_results = await asyncio.to_thread(
+            # Per-status counts and critical counts from the trigger-maintained counters (async)
+            status_results = await self._db(
                 self.db_manager.fetch_all,
-                "SELECT status, COUNT(*) FROM complaints GROUP BY status"
+                _SQL_SELECT_COMPLAINT_STATS
             )
-            for status, count in status_results:
+            for status, critical, count in status_results:
                 stats['status_counts'][status] = count
+                stats['critical_complaints'] += critical
+                stats['total_complaints'] += count
+            
+            # Only cache if no complaint was logged while the query ran
+            if version == self._stats_version:
+                self._stats_cache = (stats, time.monotonic())
             
             self.logger.info("Successfully retrieved complaint statistics")
             return stats
             
         except Exception as e:
-            self.logger.error(f"Error retrieving complaint statistics: {e}")
+            self.logger.exception(f"Error retrieving complaint statistics: {e}")
             return {
                 'total_complaints': 0,
                 'critical_complaints': 0,
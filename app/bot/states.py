@@ -8,131 +8,115 @@ This module serves as the central repository for all conversation state constant
 used throughout the bot application. It ensures consistent state management and 
 simplifies transitions between different conversation handlers.
 
-All states are defined as sequential integers starting from 0, making them suitable
-for use with python-telegram-bot's ConversationHandler.
+All states are members of the State IntEnum, numbered sequentially from 0. They
+compare and hash as plain integers, making them suitable for use with
+python-telegram-bot's ConversationHandler, and each member is also exported as a
+module-level constant (e.g. states.COLLECTING_NAME).
 
 Author: Institution Complaint Management Bot Team
 """
 
-# Define all conversation states as sequential integers
-(
+from enum import IntEnum
+
+
+class State(IntEnum):
+    """Conversation states, numbered sequentially from 0."""
+    
     # Entry Point & Initial Action States
-    SELECTING_INITIAL_ACTION,           # For handling user's choice after /start or AI greeting (e.g., Complaint, Suggestion)
+    SELECTING_INITIAL_ACTION = 0           # For handling user's choice after /start or AI greeting (e.g., Complaint, Suggestion)
 
     # Complaint Flow States
-    ASK_NEW_OR_REMINDER,               # Asks if user wants new complaint or reminder about previous one
-    HANDLE_NEW_OR_REMINDER_CHOICE,     # Processes the choice from ASK_NEW_OR_REMINDER (CallbackQuery)
-    CONFIRM_EXISTING_PROFILE,          # Asks user to confirm using existing profile data (CallbackQuery expected)
+    ASK_NEW_OR_REMINDER = 1                # Asks if user wants new complaint or reminder about previous one
+    HANDLE_NEW_OR_REMINDER_CHOICE = 2      # Processes the choice from ASK_NEW_OR_REMINDER (CallbackQuery)
+    CONFIRM_EXISTING_PROFILE = 3           # Asks user to confirm using existing profile data (CallbackQuery expected)
     
     # Profile Collection States
-    COLLECTING_NAME,                   # Collecting user's full name
-    COLLECTING_SEX,                    # Collecting user's gender/sex
-    COLLECTING_PHONE,                  # Collecting user's phone number
-    COLLECTING_EMAIL,                  # Collecting user's email address
-    COLLECTING_RESIDENCE,              # Collecting user's residence status/type
-    COLLECTING_GOVERNORATE,            # Collecting user's governorate
-    COLLECTING_GOVERNORATE_OTHER,
-    COLLECTING_DIRECTORATE,            # Collecting user's directorate/district
-    COLLECTING_VILLAGE,                # Collecting user's village/area
-    COLLECTING_AGE,             # Collecting user's department/institution
-    COLLECTING_DISABILITY,               # Collecting Disability status
+    COLLECTING_NAME = 4                    # Collecting user's full name
+    COLLECTING_SEX = 5                     # Collecting user's gender/sex
+    COLLECTING_PHONE = 6                   # Collecting user's phone number
+    COLLECTING_EMAIL = 7                   # Collecting user's email address
+    COLLECTING_RESIDENCE = 8               # Collecting user's residence status/type
+    COLLECTING_GOVERNORATE = 9             # Collecting user's governorate
+    COLLECTING_GOVERNORATE_OTHER = 10
+    COLLECTING_DIRECTORATE = 11            # Collecting user's directorate/district
+    COLLECTING_VILLAGE = 12                # Collecting user's village/area
+    COLLECTING_AGE = 13             # Collecting user's department/institution
+    COLLECTING_DISABILITY = 14               # Collecting Disability status
     
     # Complaint Content States
-    COLLECTING_NATIONALITY,         # Collecting the type/category of complaint
-    COLLECTING_COMPLAINT_TEXT,         # Collecting the actual complaint text from user
-    CONFIRM_COMPLAINT_SUBMISSION,      # For user to confirm all details before final submission (CallbackQuery)
+    COLLECTING_NATIONALITY = 15         # Collecting the type/category of complaint
+    COLLECTING_COMPLAINT_TEXT = 16         # Collecting the actual complaint text from user
+    CONFIRM_COMPLAINT_SUBMISSION = 17      # For user to confirm all details before final submission (CallbackQuery)
 
     # Critical Complaint Flow States (Expedited process for urgent matters)
-    CRITICAL_COLLECTING_NAME,          # Collecting name for critical complaints
-    CRITICAL_COLLECTING_PHONE,         # Collecting phone for critical complaints
-    CRITICAL_COLLECTING_COMPLAINT_TEXT, # Collecting complaint text for critical complaints
-    CRITICAL_CONFIRM_COMPLAINT_SUBMISSION, # Confirming submission for critical complaints
+    CRITICAL_COLLECTING_NAME = 18          # Collecting name for critical complaints
+    CRITICAL_COLLECTING_PHONE = 19         # Collecting phone for critical complaints
+    CRITICAL_COLLECTING_COMPLAINT_TEXT = 20 # Collecting complaint text for critical complaints
+    CRITICAL_CONFIRM_COMPLAINT_SUBMISSION = 21 # Confirming submission for critical complaints
 
     # Suggestion/Feedback Flow States
-    COLLECTING_SUGGESTION_TEXT,        # Collecting suggestion or feedback text from user
-    CONFIRM_SUGGESTION_SUBMISSION,     # Optional confirmation step for suggestions
+    COLLECTING_SUGGESTION_TEXT = 22        # Collecting suggestion or feedback text from user
+    CONFIRM_SUGGESTION_SUBMISSION = 23     # Optional confirmation step for suggestions
 
     # Administrative States
-    ADMIN_MENU,                        # Administrative menu for authorized users
-    ADMIN_VIEW_STATS,                  # Viewing complaint statistics
-    ADMIN_EXPORT_DATA,                 # Exporting complaint data
+    ADMIN_MENU = 24                        # Administrative menu for authorized users
+    ADMIN_VIEW_STATS = 25                  # Viewing complaint statistics
+    ADMIN_EXPORT_DATA = 26                 # Exporting complaint data
     
     # Error Handling States
-    HANDLING_ERROR,                    # Generic error handling state
-    RETRY_INPUT,                       # Asking user to retry their input
+    HANDLING_ERROR = 27                    # Generic error handling state
+    RETRY_INPUT = 28                       # Asking user to retry their input
     
     # Utility States
-    WAITING_FOR_INPUT,                 # Generic waiting state
-    PROCESSING_REQUEST,                # Processing user request state
+    WAITING_FOR_INPUT = 29                 # Generic waiting state
+    PROCESSING_REQUEST = 30                # Processing user request state
     
     # Reserved States for Future Expansion
-    RESERVED_STATE_1,                  # Reserved for future features
-    RESERVED_STATE_2,                  # Reserved for future features
-    RESERVED_STATE_3,                  # Reserved for future features
-    RESERVED_STATE_4,                  # Reserved for future features
-    RESERVED_STATE_5,                  # Reserved for future features
-
-) = range(36)  # Updated count to reflect removed states
-
-
-# State name mapping for logging and debugging purposes
-STATE_NAMES = {
-    # Entry Point & Initial Action States
-    SELECTING_INITIAL_ACTION: "SELECTING_INITIAL_ACTION",
-    
-    # Complaint Flow States
-    ASK_NEW_OR_REMINDER: "ASK_NEW_OR_REMINDER",
-    HANDLE_NEW_OR_REMINDER_CHOICE: "HANDLE_NEW_OR_REMINDER_CHOICE",
-    CONFIRM_EXISTING_PROFILE: "CONFIRM_EXISTING_PROFILE",
-    
-    # Profile Collection States
-    COLLECTING_NAME: "COLLECTING_NAME",
-    COLLECTING_SEX: "COLLECTING_SEX",
-    COLLECTING_PHONE: "COLLECTING_PHONE",
-    COLLECTING_EMAIL: "COLLECTING_EMAIL",
-    COLLECTING_RESIDENCE: "COLLECTING_RESIDENCE",
-    COLLECTING_GOVERNORATE: "COLLECTING_GOVERNORATE",
-    COLLECTING_GOVERNORATE_OTHER: "COLLECTING_GOVERNORATE_OTHER",
-    COLLECTING_DIRECTORATE: "COLLECTING_DIRECTORATE",
-    COLLECTING_VILLAGE: "COLLECTING_VILLAGE",
-    COLLECTING_AGE: "COLLECTING_AGE",
-    COLLECTING_DISABILITY: "COLLECTING_DISABILITY",
-    
-    # Complaint Content States
-    COLLECTING_NATIONALITY: "COLLECTING_NATIONALITY",
-    COLLECTING_COMPLAINT_TEXT: "COLLECTING_COMPLAINT_TEXT",
-    CONFIRM_COMPLAINT_SUBMISSION: "CONFIRM_COMPLAINT_SUBMISSION",
-    
-    # Critical Complaint Flow States
-    CRITICAL_COLLECTING_NAME: "CRITICAL_COLLECTING_NAME",
-    CRITICAL_COLLECTING_PHONE: "CRITICAL_COLLECTING_PHONE",
-    CRITICAL_COLLECTING_COMPLAINT_TEXT: "CRITICAL_COLLECTING_COMPLAINT_TEXT",
-    CRITICAL_CONFIRM_COMPLAINT_SUBMISSION: "CRITICAL_CONFIRM_COMPLAINT_SUBMISSION",
-    
-    # Suggestion/Feedback Flow States
-    COLLECTING_SUGGESTION_TEXT: "COLLECTING_SUGGESTION_TEXT",
-    CONFIRM_SUGGESTION_SUBMISSION: "CONFIRM_SUGGESTION_SUBMISSION",
-    
-    # Administrative States
-    ADMIN_MENU: "ADMIN_MENU",
-    ADMIN_VIEW_STATS: "ADMIN_VIEW_STATS",
-    ADMIN_EXPORT_DATA: "ADMIN_EXPORT_DATA",
-    
-    # Error Handling States
-    HANDLING_ERROR: "HANDLING_ERROR",
-    RETRY_INPUT: "RETRY_INPUT",
-    
-    # Utility States
-    WAITING_FOR_INPUT: "WAITING_FOR_INPUT",
-    PROCESSING_REQUEST: "PROCESSING_REQUEST",
-    
-    # Reserved States
-    RESERVED_STATE_1: "RESERVED_STATE_1",
-    RESERVED_STATE_2: "RESERVED_STATE_2",
-    RESERVED_STATE_3: "RESERVED_STATE_3",
-    RESERVED_STATE_4: "RESERVED_STATE_4",
-    RESERVED_STATE_5: "RESERVED_STATE_5",
-}
+    RESERVED_STATE_1 = 31                  # Reserved for future features
+    RESERVED_STATE_2 = 32                  # Reserved for future features
+    RESERVED_STATE_3 = 33                  # Reserved for future features
+    RESERVED_STATE_4 = 34                  # Reserved for future features
+    RESERVED_STATE_5 = 35                  # Reserved for future features
+
+
+# Every state as a module-level constant (states.COLLECTING_NAME, ...), spelled
+# out so static tooling and imports can see the names
+SELECTING_INITIAL_ACTION = State.SELECTING_INITIAL_ACTION
+ASK_NEW_OR_REMINDER = State.ASK_NEW_OR_REMINDER
+HANDLE_NEW_OR_REMINDER_CHOICE = State.HANDLE_NEW_OR_REMINDER_CHOICE
+CONFIRM_EXISTING_PROFILE = State.CONFIRM_EXISTING_PROFILE
+COLLECTING_NAME = State.COLLECTING_NAME
+COLLECTING_SEX = State.COLLECTING_SEX
+COLLECTING_PHONE = State.COLLECTING_PHONE
+COLLECTING_EMAIL = State.COLLECTING_EMAIL
+COLLECTING_RESIDENCE = State.COLLECTING_RESIDENCE
+COLLECTING_GOVERNORATE = State.COLLECTING_GOVERNORATE
+COLLECTING_GOVERNORATE_OTHER = State.COLLECTING_GOVERNORATE_OTHER
+COLLECTING_DIRECTORATE = State.COLLECTING_DIRECTORATE
+COLLECTING_VILLAGE = State.COLLECTING_VILLAGE
+COLLECTING_AGE = State.COLLECTING_AGE
+COLLECTING_DISABILITY = State.COLLECTING_DISABILITY
+COLLECTING_NATIONALITY = State.COLLECTING_NATIONALITY
+COLLECTING_COMPLAINT_TEXT = State.COLLECTING_COMPLAINT_TEXT
+CONFIRM_COMPLAINT_SUBMISSION = State.CONFIRM_COMPLAINT_SUBMISSION
+CRITICAL_COLLECTING_NAME = State.CRITICAL_COLLECTING_NAME
+CRITICAL_COLLECTING_PHONE = State.CRITICAL_COLLECTING_PHONE
+CRITICAL_COLLECTING_COMPLAINT_TEXT = State.CRITICAL_COLLECTING_COMPLAINT_TEXT
+CRITICAL_CONFIRM_COMPLAINT_SUBMISSION = State.CRITICAL_CONFIRM_COMPLAINT_SUBMISSION
+COLLECTING_SUGGESTION_TEXT = State.COLLECTING_SUGGESTION_TEXT
+CONFIRM_SUGGESTION_SUBMISSION = State.CONFIRM_SUGGESTION_SUBMISSION
+ADMIN_MENU = State.ADMIN_MENU
+ADMIN_VIEW_STATS = State.ADMIN_VIEW_STATS
+ADMIN_EXPORT_DATA = State.ADMIN_EXPORT_DATA
+HANDLING_ERROR = State.HANDLING_ERROR
+RETRY_INPUT = State.RETRY_INPUT
+WAITING_FOR_INPUT = State.WAITING_FOR_INPUT
+PROCESSING_REQUEST = State.PROCESSING_REQUEST
+RESERVED_STATE_1 = State.RESERVED_STATE_1
+RESERVED_STATE_2 = State.RESERVED_STATE_2
+RESERVED_STATE_3 = State.RESERVED_STATE_3
+RESERVED_STATE_4 = State.RESERVED_STATE_4
+RESERVED_STATE_5 = State.RESERVED_STATE_5
 
 
 def get_state_name(state_code: int) -> str:
@@ -148,7 +132,7 @@ def get_state_name(state_code: int) -> str:
         
     Returns:
         str: Human-readable state name or "UNKNOWN_STATE_<code>" if the 
-             state code is not found in the STATE_NAMES dictionary
+             state code is not a defined State
              
     Example:
         >>> get_state_name(COLLECTING_NAME)
@@ -156,7 +140,8 @@ def get_state_name(state_code: int) -> str:
         >>> get_state_name(999)
         'UNKNOWN_STATE_999'
     """
-    return STATE_NAMES.get(state_code, f"UNKNOWN_STATE_{state_code}")
+    state = State._value2member_map_.get(state_code)
+    return state.name if state is not None else f"UNKNOWN_STATE_{state_code}"
 
 
 def is_valid_state(state_code: int) -> bool:
@@ -175,7 +160,7 @@ def is_valid_state(state_code: int) -> bool:
         >>> is_valid_state(999)
         False
     """
-    return state_code in STATE_NAMES
+    return state_code in State._value2member_map_
 
 
 def get_all_states() -> list[int]:
@@ -188,9 +173,9 @@ def get_all_states() -> list[int]:
     Example:
         >>> states = get_all_states()
         >>> len(states)
-        39
+        36
     """
-    return list(STATE_NAMES.keys())
+    return list(State)
 
 
 def get_states_by_category() -> dict[str, list[int]]:
@@ -207,26 +192,26 @@ def get_states_by_category() -> dict[str, list[int]]:
         [1, 2, 3, ...]
     """
     return {
-        'entry_point': [SELECTING_INITIAL_ACTION],
+        'entry_point': [State.SELECTING_INITIAL_ACTION],
         'complaint_flow': [
-            ASK_NEW_OR_REMINDER, HANDLE_NEW_OR_REMINDER_CHOICE, 
-            CONFIRM_EXISTING_PROFILE, COLLECTING_NATIONALITY,
-            COLLECTING_COMPLAINT_TEXT, CONFIRM_COMPLAINT_SUBMISSION
+            State.ASK_NEW_OR_REMINDER, State.HANDLE_NEW_OR_REMINDER_CHOICE, 
+            State.CONFIRM_EXISTING_PROFILE, State.COLLECTING_NATIONALITY,
+            State.COLLECTING_COMPLAINT_TEXT, State.CONFIRM_COMPLAINT_SUBMISSION
         ],
         'profile_collection': [
-            COLLECTING_NAME, COLLECTING_SEX, COLLECTING_PHONE,
-            COLLECTING_EMAIL, COLLECTING_RESIDENCE, COLLECTING_GOVERNORATE,
-            COLLECTING_DIRECTORATE, COLLECTING_VILLAGE, COLLECTING_AGE,
-            COLLECTING_DISABILITY
+            State.COLLECTING_NAME, State.COLLECTING_SEX, State.COLLECTING_PHONE,
+            State.COLLECTING_EMAIL, State.COLLECTING_RESIDENCE, State.COLLECTING_GOVERNORATE,
+            State.COLLECTING_DIRECTORATE, State.COLLECTING_VILLAGE, State.COLLECTING_AGE,
+            State.COLLECTING_DISABILITY
         ],
         'critical_flow': [
-            CRITICAL_COLLECTING_NAME, CRITICAL_COLLECTING_PHONE,
-            CRITICAL_COLLECTING_COMPLAINT_TEXT, CRITICAL_CONFIRM_COMPLAINT_SUBMISSION
+            State.CRITICAL_COLLECTING_NAME, State.CRITICAL_COLLECTING_PHONE,
+            State.CRITICAL_COLLECTING_COMPLAINT_TEXT, State.CRITICAL_CONFIRM_COMPLAINT_SUBMISSION
         ],
-        'suggestion_flow': [COLLECTING_SUGGESTION_TEXT, CONFIRM_SUGGESTION_SUBMISSION],
-        'administrative': [ADMIN_MENU, ADMIN_VIEW_STATS, ADMIN_EXPORT_DATA],
-        'error_handling': [HANDLING_ERROR, RETRY_INPUT],
-        'utility': [WAITING_FOR_INPUT, PROCESSING_REQUEST],
-        'reserved': [RESERVED_STATE_1, RESERVED_STATE_2, RESERVED_STATE_3, 
-                    RESERVED_STATE_4, RESERVED_STATE_5]
-    }
\ No newline at end of file
+        'suggestion_flow': [State.COLLECTING_SUGGESTION_TEXT, State.CONFIRM_SUGGESTION_SUBMISSION],
+        'administrative': [State.ADMIN_MENU, State.ADMIN_VIEW_STATS, State.ADMIN_EXPORT_DATA],
+        'error_handling': [State.HANDLING_ERROR, State.RETRY_INPUT],
+        'utility': [State.WAITING_FOR_INPUT, State.PROCESSING_REQUEST],
+        'reserved': [State.RESERVED_STATE_1, State.RESERVED_STATE_2, State.RESERVED_STATE_3, 
+                    State.RESERVED_STATE_4, State.RESERVED_STATE_5]
+    }
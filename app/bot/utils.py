@@ -16,11 +16,13 @@ Core Philosophy:
 - Comprehensive message coverage for all handler modules
 """
 
+import asyncio
 import logging
 
 import re
-from functools import wraps
-from typing import Dict, Any, Optional, TYPE_CHECKING
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, TYPE_CHECKING
 from telegram import Update, ReplyKeyboardMarkup, KeyboardButton, InlineKeyboardMarkup, InlineKeyboardButton, constants
 from telegram.ext import ContextTypes
 
@@ -30,14 +32,66 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-def send_typing_action(func):
-    """Decorator that sends a 'typing' action to the user."""
+# Eastern Arabic (Hindi) and Persian numerals -> Western Arabic numerals, built once
+_EASTERN_NUMERALS_TABLE = str.maketrans('٠١٢٣٤٥٦٧٨٩۰۱۲۳۴۵۶۷۸۹', '01234567890123456789')
+
+# Separators stripped from phone numbers before pattern matching
+_PHONE_SEPARATORS_RE = re.compile(r'[\s\-()]')
+
+# Accepted spellings of the institution's primary_language setting
+_ARABIC_LANGUAGE_NAMES = frozenset({'ar', 'arabic', 'العربية'})
+_ENGLISH_LANGUAGE_NAMES = frozenset({'en', 'english'})
+
+# Fallback Yemeni phone patterns, used when the config provides none
+_FALLBACK_PHONE_RE = re.compile(r'(?:^07\d{8}$)|(?:^\+9677\d{8}$)')
+
+# Email validation pattern, shared by every handler that accepts an email address
+EMAIL_REGEX = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# MarkdownV2 special characters, backslash first so inserted escapes are not escaped again
+_MARKDOWN_V2_SPECIAL_CHARS = tuple((c, '\\' + c) for c in '\\_*[]()~`>#+-=|{}.!')
+
+# Handlers expected to reply faster than this skip the 'typing' action
+_TYPING_ACTION_MIN_DURATION_MS = 100
+
+# In-flight 'typing' chat actions, referenced until they complete
+_chat_action_tasks: set = set()
+
+def _on_chat_action_done(task: asyncio.Task) -> None:
+    """Release a finished chat action task; failures are cosmetic and only logged."""
+    _chat_action_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.debug(f"Could not send typing action: {task.exception()}")
+
+def send_typing_action(func=None, *, expected_duration_ms: int = _TYPING_ACTION_MIN_DURATION_MS):
+    """
+    Decorator that sends a 'typing' action to the user.
+    
+    The action is sent in the background, so the handler doesn't wait for
+    the extra Bot API round-trip before doing its work. The bot's reply clears
+    the indicator, so for handlers expected to answer in under
+    _TYPING_ACTION_MIN_DURATION_MS it would never be seen; those are returned
+    undecorated. Without an expected duration the action is always sent.
+    
+    Usage:
+        @send_typing_action                              # always sends the action
+        @send_typing_action(expected_duration_ms=2000)   # e.g. waits on the LLM
+        @send_typing_action(expected_duration_ms=50)     # quick handler: no-op
+    """
+    if func is None:
+        return lambda f: send_typing_action(f, expected_duration_ms=expected_duration_ms)
+    
+    if expected_duration_ms < _TYPING_ACTION_MIN_DURATION_MS:
+        return func
+    
     @wraps(func)
     async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
-        await context.bot.send_chat_action(
+        task = asyncio.create_task(context.bot.send_chat_action(
             chat_id=update.effective_chat.id,
             action=constants.ChatAction.TYPING
-        )
+        ))
+        _chat_action_tasks.add(task)
+        task.add_done_callback(_on_chat_action_done)
         return await func(update, context, *args, **kwargs)
     return wrapper
 
@@ -47,13 +101,18 @@ def escape_markdown_v2(text: str) -> str:
     This is crucial to prevent errors when sending text that might
     contain special Markdown characters like *, _, `, etc.
     """
-    # List of characters to escape: _ * [ ] ( ) ~ ` > # + - = | { } . !
-    escape_chars = r'_*[]()~`>#+-=|{}.!'
-    # Use re.sub to add a backslash before each special character
-    return re.sub(f'([\\\\{escape_chars}])', r'\\\\\\1', str(text))
+    # Add a single backslash before each special character. str.replace scans
+    # in C even for non-ASCII text, where str.translate falls back to a
+    # per-character mapping lookup.
+    if type(text) is not str:
+        text = str(text)
+    for char, escaped in _MARKDOWN_V2_SPECIAL_CHARS:
+        if char in text:
+            text = text.replace(char, escaped)
+    return text
 
 # Comprehensive default messages dictionary supporting Arabic and English
-DEFAULT_MESSAGES: Dict[str, Dict[str, str]] = {
+DEFAULT_MESSAGES: Mapping[str, Mapping[str, str]] = {
     'ar': {
         # Welcome and main menu messages
         'start_command_response': "مرحباً بك في نظام إدارة الشكاوى والملاحظات الخاص بـ {institution_name}.\n\nلبدء محادثة، يرجى كتابة طلبك أو شكواك مباشرة في أي وقت.",
@@ -111,13 +170,7 @@ DEFAULT_MESSAGES: Dict[str, Dict[str, str]] = {
         'input_too_short': "❌ النص قصير جداً. يرجى تقديم المزيد من التفاصيل",
         
         # New messages from complaint_flow_handlers.py
-        'prompt_enter_residence': "الرجاء تحديد حالة الإقامة:",
-        'prompt_enter_governorate': "الرجاء تحديد المحافظة:",
-        'prompt_enter_directorate': "الرجاء تحديد المديرية:",
-        'prompt_enter_village': "الرجاء تحديد القرية/الحي:",
         'prompt_select_disability': "هل لديك أي إعاقة؟",
-        'critical_complaint_detected_prompt_name': "❗ تم تحديد أن شكواك عاجلة. يرجى إدخال اسمك الكامل:",
-        'prompt_enter_critical_phone': "❗ يرجى إدخال رقم هاتف للتواصل العاجل:",
         'validation_error_name': "❌ يرجى إدخال اسم صحيح (اسمين على الأقل)",
         'validation_error_phone': "❌ رقم الهاتف غير صحيح. يرجى إدخال رقم صحيح",
         
@@ -341,13 +394,7 @@ DEFAULT_MESSAGES: Dict[str, Dict[str, str]] = {
         'input_too_short': "❌ The text is too short. Please provide more details",
         
         # New messages from complaint_flow_handlers.py
-        'prompt_enter_residence': "Please specify your residence status:",
-        'prompt_enter_governorate': "Please specify the governorate:",
-        'prompt_enter_directorate': "Please specify the directorate:",
-        'prompt_enter_village': "Please specify the village/area:",
         'prompt_select_disability': "Do you have any disability?",
-        'critical_complaint_detected_prompt_name': "❗ Your complaint has been flagged as urgent. Please enter your full name:",
-        'prompt_enter_critical_phone': "❗ Please enter an urgent contact phone number:",
         'validation_error_name': "❌ Please enter a valid name (at least two words)",
         'validation_error_phone': "❌ Invalid phone number. Please enter a valid number",
         'validation_error_age': "❌ Invalid age entered. Please enter a valid number.",
@@ -516,6 +563,26 @@ DEFAULT_MESSAGES: Dict[str, Dict[str, str]] = {
     }
 }
 
+# Freeze the message tables against accidental mutation. The message keys are
+# identifier-like string literals, which CPython already interns.
+DEFAULT_MESSAGES = MappingProxyType({
+    language: MappingProxyType(messages) for language, messages in DEFAULT_MESSAGES.items()
+})
+
+# Flat (language, key) -> template view of DEFAULT_MESSAGES for get_message,
+# resolving a message with a single dict lookup
+_FLAT_MESSAGES: Dict[tuple, str] = {
+    (language, key): template
+    for language, messages in DEFAULT_MESSAGES.items()
+    for key, template in messages.items()
+}
+
+# Messages without any {placeholder}; get_message returns these as-is, skipping
+# the config placeholder lookups and str.format_map
+_PLAIN_MESSAGES: frozenset = frozenset(
+    message_id for message_id, template in _FLAT_MESSAGES.items() if '{' not in template
+)
+
 
 def get_user_preferred_language_is_arabic(update: Update, bot_instance: 'InstitutionBot') -> bool:
     """
@@ -534,33 +601,117 @@ def get_user_preferred_language_is_arabic(update: Update, bot_instance: 'Institu
         bool: True if Arabic is preferred, False for English
     """
     try:
-        # Check user's Telegram language preference
-        if update.effective_user and update.effective_user.language_code:
-            user_lang = update.effective_user.language_code.lower()
-            # Arabic language codes: ar, ar-SA, ar-EG, etc.
-            if user_lang.startswith('ar'):
-                return True
-            # English language codes: en, en-US, en-GB, etc.
-            elif user_lang.startswith('en'):
-                return False
-        
-        # Fall back to institution's primary language from config
+        user = update.effective_user
+        language_code = user.language_code if user else None
+        
+        primary_language = None
         if hasattr(bot_instance, 'config') and bot_instance.config:
             institution_config = bot_instance.config.institution
-            primary_lang = institution_config.primary_language.lower() if hasattr(institution_config, 'primary_language') else 'ar'
-            if primary_lang in ['ar', 'arabic', 'العربية']:
-                return True
-            elif primary_lang in ['en', 'english']:
-                return False
+            primary_language = getattr(institution_config, 'primary_language', 'ar')
         
-        # Default to Arabic
-        return True
+        return _resolve_is_arabic(language_code, primary_language)
         
     except Exception as e:
         logger.warning(f"Error determining user language preference: {e}")
         return True  # Default to Arabic
 
 
+@lru_cache(maxsize=4096)
+def _resolve_is_arabic(language_code: Optional[str], primary_language: Optional[str]) -> bool:
+    """
+    Resolve the Arabic/English choice from the user's Telegram language code and
+    the institution's primary language (None if there is no config).
+    
+    Pure and memoized: the same few code pairs recur on every update.
+    """
+    # Check user's Telegram language preference
+    if language_code:
+        # Only the two-letter primary subtag matters
+        prefix = language_code[:2].lower()
+        # Arabic language codes: ar, ar-SA, ar-EG, etc.
+        if prefix == 'ar':
+            return True
+        # English language codes: en, en-US, en-GB, etc.
+        elif prefix == 'en':
+            return False
+    
+    # Fall back to institution's primary language from config
+    if primary_language is not None:
+        primary_lang = primary_language.lower()
+        if primary_lang in _ARABIC_LANGUAGE_NAMES:
+            return True
+        elif primary_lang in _ENGLISH_LANGUAGE_NAMES:
+            return False
+    
+    # Default to Arabic
+    return True
+
+
+# (id(config), is_arabic) -> (config, placeholders); the config reference is
+# kept so a recycled id() can never serve another config's values
+_placeholder_cache: Dict[tuple, tuple] = {}
+
+
+def _common_placeholders(bot_instance: 'InstitutionBot', is_arabic_reply: bool) -> Mapping[str, Any]:
+    """
+    Return the institution/contact placeholders shared by all messages.
+    
+    The values only depend on the (immutable) config and the reply language,
+    so they are read from the config models once and reused for every message.
+    """
+    config = getattr(bot_instance, 'config', None)
+    if not config:
+        return {}
+    
+    cache_key = (id(config), is_arabic_reply)
+    cached = _placeholder_cache.get(cache_key)
+    if cached is not None and cached[0] is config:
+        return cached[1]
+    
+    format_kwargs = {}
+    institution_config = config.institution
+    contact_config = institution_config.contact
+    
+    # Determine institution name based on reply language
+    inst_name_key = 'name_ar' if is_arabic_reply else 'name_en'
+    default_inst_name = 'المؤسسة' if is_arabic_reply else 'The Institution'
+    format_kwargs['institution_name'] = getattr(
+        institution_config, 
+        inst_name_key, 
+        getattr(institution_config, 'name', default_inst_name)
+    )
+    
+    # Contact information with robust fallbacks
+    format_kwargs['phone'] = getattr(contact_config, 'phone', '[Phone Placeholder]')
+    format_kwargs['email'] = getattr(contact_config, 'email', '[Email Placeholder]')
+    
+    # Address with language-specific variants
+    address_key = 'address_ar' if is_arabic_reply else 'address_en'
+    format_kwargs['address'] = getattr(
+        contact_config, 
+        address_key, 
+        getattr(contact_config, 'address', '[Address Placeholder]')
+    )
+    
+    # Additional common placeholders
+    format_kwargs['website'] = getattr(institution_config, 'website', '[Website Placeholder]')
+    format_kwargs['response_time'] = getattr(
+        institution_config, 
+        'response_time', 
+        '48 ساعة' if is_arabic_reply else '48 hours'
+    )
+    
+    # Contact info for help messages
+    contact_info = f"{format_kwargs['phone']}"
+    if format_kwargs['email'] != '[Email Placeholder]':
+        contact_info += f" - {format_kwargs['email']}"
+    format_kwargs['contact_info'] = contact_info
+    
+    placeholders = MappingProxyType(format_kwargs)
+    _placeholder_cache[cache_key] = (config, placeholders)
+    return placeholders
+
+
 def get_message(message_key: str, bot_instance: 'InstitutionBot', is_arabic_reply: bool, **kwargs) -> str:
     """
     Retrieve a localized message with placeholder formatting.
@@ -583,56 +734,19 @@ def get_message(message_key: str, bot_instance: 'InstitutionBot', is_arabic_repl
     
     try:
         # Get message directly from the default dictionary
-        message_template = None
-        if language in DEFAULT_MESSAGES and message_key in DEFAULT_MESSAGES[language]:
-            message_template = DEFAULT_MESSAGES[language][message_key]
+        message_id = (language, message_key)
+        if message_id in _PLAIN_MESSAGES:
+            return _FLAT_MESSAGES[message_id]
+        
+        message_template = _FLAT_MESSAGES.get(message_id)
         # If no message found, return error placeholder
         if message_template is None:
             logger.warning(f"Message key '{message_key}' not found for language '{language}'")
             return f"[MSG_NOT_FOUND: {message_key}]"
         
-        # Prepare common placeholders from bot config with refined access
-        format_kwargs = {}  # Start with empty dict for clarity
-        if hasattr(bot_instance, 'config') and bot_instance.config:
-            institution_config = bot_instance.config.institution
-            contact_config = institution_config.contact
-            
-            # Determine institution name based on reply language
-            inst_name_key = 'name_ar' if is_arabic_reply else 'name_en'
-            default_inst_name = 'المؤسسة' if is_arabic_reply else 'The Institution'
-            format_kwargs['institution_name'] = getattr(
-                institution_config, 
-                inst_name_key, 
-                getattr(institution_config, 'name', default_inst_name)
-            )
-            
-            # Contact information with robust fallbacks
-            format_kwargs['phone'] = getattr(contact_config, 'phone', '[Phone Placeholder]')
-            format_kwargs['email'] = getattr(contact_config, 'email', '[Email Placeholder]')
-            
-            # Address with language-specific variants
-            address_key = 'address_ar' if is_arabic_reply else 'address_en'
-            format_kwargs['address'] = getattr(
-                contact_config, 
-                address_key, 
-                getattr(contact_config, 'address', '[Address Placeholder]')
-            )
-            
-            # Additional common placeholders
-            format_kwargs['website'] = getattr(institution_config, 'website', '[Website Placeholder]')
-            format_kwargs['response_time'] = getattr(
-                institution_config, 
-                'response_time', 
-                '48 ساعة' if is_arabic_reply else '48 hours'
-            )
-            
-            # Contact info for help messages
-            contact_info = f"{format_kwargs['phone']}"
-            if format_kwargs['email'] != '[Email Placeholder]':
-                contact_info += f" - {format_kwargs['email']}"
-            format_kwargs['contact_info'] = contact_info
-        
-        # Merge with explicitly passed kwargs (kwargs take precedence)
+        # Common placeholders from bot config, merged with explicitly passed
+        # kwargs (kwargs take precedence)
+        format_kwargs = dict(_common_placeholders(bot_instance, is_arabic_reply))
         format_kwargs.update(kwargs)
         
         # Format message with placeholders
@@ -648,6 +762,18 @@ def get_message(message_key: str, bot_instance: 'InstitutionBot', is_arabic_repl
         return f"[ERROR: {message_key}]"
 
 
+@lru_cache(maxsize=32)
+def _compile_phone_patterns(patterns: tuple) -> re.Pattern:
+    """
+    Fuse a tuple of phone regex patterns into one compiled alternation.
+    
+    Matching the alternation at the start of the string is equivalent to
+    trying each pattern in turn with re.match, but runs in a single call.
+    Compiled once per pattern tuple; configs pass the same list every time.
+    """
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+
+
 def validate_phone_number(phone: str, patterns: list[str]) -> bool:
     """
     Validate phone number format based on a list of regex patterns.
@@ -662,35 +788,64 @@ def validate_phone_number(phone: str, patterns: list[str]) -> bool:
     if not patterns:
         logger.warning("No phone validation patterns provided. Using fallback.")
         # Fallback to hardcoded Yemeni phone patterns
-        patterns = [
-            r'^07\d{8}$',
-            r'^\+9677\d{8}$',
-        ]
+        phone_re = _FALLBACK_PHONE_RE
+    else:
+        phone_re = _compile_phone_patterns(tuple(patterns))
 
-    # Create mapping for Eastern Arabic (Hindi) numerals to Western Arabic numerals
-    numeral_map = {
-        '٠': '0', '۰': '0',
-        '١': '1', '۱': '1',
-        '٢': '2', '۲': '2',
-        '٣': '3', '۳': '3',
-        '٤': '4', '۴': '4',
-        '٥': '5', '۵': '5',
-        '٦': '6', '۶': '6',
-        '٧': '7', '۷': '7',
-        '٨': '8', '۸': '8',
-        '٩': '9', '۹': '9'
-    }
-    
     # Normalize the phone number by replacing Eastern Arabic numerals
-    normalized_phone = ''.join([numeral_map.get(c, c) for c in str(phone)])
+    normalized_phone = str(phone).translate(_EASTERN_NUMERALS_TABLE)
     
     # Clean the phone number input (remove spaces, hyphens, etc.)
-    clean_phone = re.sub(r'[\s\-()]', '', normalized_phone)
+    clean_phone = _PHONE_SEPARATORS_RE.sub('', normalized_phone)
     
     # Check against all provided patterns
-    return any(re.match(pattern, clean_phone) for pattern in patterns)
+    return phone_re.match(clean_phone) is not None
+
+
+def _cached_per_language(builder):
+    """
+    Cache a static keyboard per language (and any extra arguments).
+    
+    Only for keyboards whose labels are placeholder-free DEFAULT_MESSAGES entries,
+    so the markup doesn't depend on bot_instance. python-telegram-bot markup
+    objects are immutable, so one instance can be sent to every user.
+    """
+    cache = {}
+    
+    @wraps(builder)
+    def wrapper(bot_instance: 'InstitutionBot', is_arabic: bool, *args, **kwargs):
+        key = (bool(is_arabic), args, tuple(sorted(kwargs.items())))
+        markup = cache.get(key)
+        if markup is None:
+            markup = cache[key] = builder(bot_instance, is_arabic, *args, **kwargs)
+        return markup
+    return wrapper
 
 
+def _cached_per_config(builder):
+    """
+    Cache a keyboard built from config selection options per config and language.
+    
+    Like _cached_per_language, but the config object is part of the key (and
+    kept in the entry, so a recycled id() never serves another config's
+    markup). Without a config nothing is cached and the builder runs as before.
+    """
+    cache = {}
+    
+    @wraps(builder)
+    def wrapper(bot_instance: 'InstitutionBot', is_arabic: bool):
+        config = getattr(bot_instance, 'config', None)
+        if not config:
+            return builder(bot_instance, is_arabic)
+        key = (id(config), bool(is_arabic))
+        entry = cache.get(key)
+        if entry is None or entry[0] is not config:
+            entry = cache[key] = (config, builder(bot_instance, is_arabic))
+        return entry[1]
+    return wrapper
+
+
+@_cached_per_language
 def get_sex_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> InlineKeyboardMarkup:
     """
     Create an inline keyboard for gender selection with localized labels.
@@ -720,6 +875,7 @@ def get_sex_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> InlineK
     return InlineKeyboardMarkup(keyboard)
 
 
+@_cached_per_config
 def get_residence_status_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> InlineKeyboardMarkup:
     """
     Create an inline keyboard for residence status selection with localized labels.
@@ -754,6 +910,7 @@ def get_residence_status_keyboard(bot_instance: 'InstitutionBot', is_arabic: boo
     return InlineKeyboardMarkup(keyboard)
 
 
+@_cached_per_config
 def get_governorates_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> InlineKeyboardMarkup:
     """
     Create an inline keyboard for governorate selection with localized labels.
@@ -788,6 +945,7 @@ def get_governorates_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -
     return InlineKeyboardMarkup(keyboard)
 
 
+@_cached_per_language
 def get_main_menu_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> ReplyKeyboardMarkup:
     """
     Create the main menu keyboard with localized options.
@@ -818,6 +976,7 @@ def get_main_menu_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> R
     )
 
 
+@_cached_per_language
 def get_initial_action_buttons_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> InlineKeyboardMarkup:
     """
     Create an inline keyboard with initial action buttons for complaint, suggestion, and feedback.
@@ -847,6 +1006,7 @@ def get_initial_action_buttons_keyboard(bot_instance: 'InstitutionBot', is_arabi
     return InlineKeyboardMarkup(keyboard)
 
 
+@_cached_per_language
 def get_yes_no_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> ReplyKeyboardMarkup:
     """
     Create a Yes/No keyboard with localized labels.
@@ -872,6 +1032,7 @@ def get_yes_no_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> Repl
     )
 
 
+@_cached_per_language
 def get_confirm_cancel_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> ReplyKeyboardMarkup:
     """
     Create a Confirm/Cancel keyboard with localized labels.
@@ -897,6 +1058,7 @@ def get_confirm_cancel_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool)
     )
 
 
+@_cached_per_language
 def get_back_main_menu_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> ReplyKeyboardMarkup:
     """
     Create a keyboard with Back and Main Menu options.
@@ -922,6 +1084,7 @@ def get_back_main_menu_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool)
     )
 
 
+@_cached_per_language
 def get_new_or_followup_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> ReplyKeyboardMarkup:
     """
     Create a keyboard for choosing between new complaint or follow-up.
@@ -948,6 +1111,7 @@ def get_new_or_followup_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool
     )
 
 
+@_cached_per_language
 def get_text_choice_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> ReplyKeyboardMarkup:
     """
     Create a keyboard for choosing between original text or writing new text.
@@ -988,9 +1152,7 @@ def validate_email(email: str) -> bool:
     if not email or email.strip() == '':
         return False
     
-    # Basic email regex pattern
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email.strip()))
+    return bool(EMAIL_REGEX.match(email.strip()))
 
 
 def validate_age(age_str: str) -> tuple[bool, Optional[int]]:
@@ -1012,6 +1174,29 @@ def validate_age(age_str: str) -> tuple[bool, Optional[int]]:
         return False, None
 
 
+# Field labels for format_complaint_details, per language
+_COMPLAINT_DETAIL_LABELS_AR = MappingProxyType({
+    'name': "الاسم",
+    'phone': "الهاتف",
+    'email': "البريد الإلكتروني",
+    'sex': "الجنس",
+    'age': "العمر",
+    'description': "وصف الشكوى",
+    'location': "الموقع",
+    'not_specified': "غير محدد",
+})
+_COMPLAINT_DETAIL_LABELS_EN = MappingProxyType({
+    'name': "Name",
+    'phone': "Phone",
+    'email': "Email",
+    'sex': "Gender",
+    'age': "Age",
+    'description': "Complaint Description",
+    'location': "Location",
+    'not_specified': "Not specified",
+})
+
+
 def format_complaint_details(complaint_data: Dict[str, Any], is_arabic: bool) -> str:
     """
     Format complaint details for review display.
@@ -1023,43 +1208,24 @@ def format_complaint_details(complaint_data: Dict[str, Any], is_arabic: bool) ->
     Returns:
         str: Formatted complaint details string
     """
-    if is_arabic:
-        details = f"""الاسم: {complaint_data.get('name', 'غير محدد')}
-الهاتف: {complaint_data.get('phone', 'غير محدد')}"""
-        
-        if complaint_data.get('email'):
-            details += f"\nالبريد الإلكتروني: {complaint_data['email']}"
-        
-        if complaint_data.get('sex'):
-            details += f"\nالجنس: {complaint_data['sex']}"
-        
-        if complaint_data.get('age'):
-            details += f"\nالعمر: {complaint_data['age']}"
-        
-        details += f"\nوصف الشكوى: {complaint_data.get('description', 'غير محدد')}"
-        
-        if complaint_data.get('location'):
-            details += f"\nالموقع: {complaint_data['location']}"
-            
-    else:
-        details = f"""Name: {complaint_data.get('name', 'Not specified')}
-Phone: {complaint_data.get('phone', 'Not specified')}"""
-        
-        if complaint_data.get('email'):
-            details += f"\nEmail: {complaint_data['email']}"
-        
-        if complaint_data.get('sex'):
-            details += f"\nGender: {complaint_data['sex']}"
-        
-        if complaint_data.get('age'):
-            details += f"\nAge: {complaint_data['age']}"
-        
-        details += f"\nComplaint Description: {complaint_data.get('description', 'Not specified')}"
-        
-        if complaint_data.get('location'):
-            details += f"\nLocation: {complaint_data['location']}"
+    labels = _COMPLAINT_DETAIL_LABELS_AR if is_arabic else _COMPLAINT_DETAIL_LABELS_EN
+    not_specified = labels['not_specified']
+    
+    lines = [
+        f"{labels['name']}: {complaint_data.get('name', not_specified)}",
+        f"{labels['phone']}: {complaint_data.get('phone', not_specified)}",
+    ]
+    
+    for field in ('email', 'sex', 'age'):
+        if complaint_data.get(field):
+            lines.append(f"{labels[field]}: {complaint_data[field]}")
+    
+    lines.append(f"{labels['description']}: {complaint_data.get('description', not_specified)}")
+    
+    if complaint_data.get('location'):
+        lines.append(f"{labels['location']}: {complaint_data['location']}")
     
-    return details
+    return "\n".join(lines)
 
 
 def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
@@ -1107,6 +1273,7 @@ def sanitize_input(text: str, max_length: Optional[int] = None) -> str:
     return sanitized
 
 
+@_cached_per_language
 def get_next_step_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> ReplyKeyboardMarkup:
     """
     Create a keyboard with Next and Back options.
@@ -1133,6 +1300,7 @@ def get_next_step_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> R
     )
 
 
+@_cached_per_language
 def get_submit_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> ReplyKeyboardMarkup:
     """
     Create a keyboard with Submit and Cancel options.
@@ -1158,6 +1326,7 @@ def get_submit_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> Repl
     )
 
 
+@_cached_per_language
 def get_new_reminder_inline_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> InlineKeyboardMarkup:
     """
     Create an inline keyboard for choosing between new complaint or reminder.
@@ -1182,6 +1351,7 @@ def get_new_reminder_inline_keyboard(bot_instance: 'InstitutionBot', is_arabic:
     return InlineKeyboardMarkup(keyboard)
 
 
+@_cached_per_language
 def get_confirm_profile_inline_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> InlineKeyboardMarkup:
     """
     Create an inline keyboard for confirming profile data usage.
@@ -1206,6 +1376,7 @@ def get_confirm_profile_inline_keyboard(bot_instance: 'InstitutionBot', is_arabi
     return InlineKeyboardMarkup(keyboard)
 
 
+@_cached_per_language
 def get_complaint_text_choice_inline_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> InlineKeyboardMarkup:
     """
     Create an inline keyboard for choosing between original or new complaint text.
@@ -1230,6 +1401,7 @@ def get_complaint_text_choice_inline_keyboard(bot_instance: 'InstitutionBot', is
     return InlineKeyboardMarkup(keyboard)
 
 
+@_cached_per_language
 def get_final_submission_inline_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool, prefix: str = "final_submission") -> InlineKeyboardMarkup:
     """
     Create an inline keyboard for final submission confirmation.
@@ -1265,6 +1437,7 @@ def log_conversation_state_change(user_id: int, action: str, state_value: int =
     else:
         logger.info(f"[CONVO_TRACE] User {user_id} - Action: {action}")
         
+@_cached_per_language
 def get_disability_keyboard(bot_instance: 'InstitutionBot', is_arabic: bool) -> InlineKeyboardMarkup:
     """Creates an inline keyboard for disability selection."""
     keyboard = [
@@ -7,9 +7,11 @@ for the application's configuration structure, including both YAML-based
 settings and environment variable secrets.
 """
 
+import copy
 from typing import Dict, List, Any, Optional
 from os import getenv
 from datetime import datetime
+from functools import lru_cache
 from pydantic import BaseModel, Field, EmailStr, HttpUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -384,8 +386,7 @@ class AppConfig(BaseModel):
     
     class Config:
         """Pydantic configuration for immutability and validation."""
-        frozen = False  # The model is subject to change after initialization.
-        validate_assignment = True  # Validates assignments to model fields
+        frozen = True  # Top-level sections are fixed once loaded; use model_copy(update=...) to derive a variant
         extra = 'forbid'  # Forbids extra fields not defined in the model
 
 
@@ -408,18 +409,30 @@ def load_config_from_yaml(yaml_file_path: str) -> AppConfig:
         FileNotFoundError: If the YAML file doesn't exist
     """
     import yaml
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
     
-    with open(yaml_file_path, 'r', encoding='utf-8') as file:
-        yaml_data = yaml.safe_load(file)
+    with open(yaml_file_path, 'rb') as file:
+        yaml_data = yaml.load(file, Loader=SafeLoader)
     
     return AppConfig(**yaml_data)
 
 
+@lru_cache(maxsize=1)
+def _build_config_schema() -> Dict[str, Any]:
+    """Generate the configuration JSON schema once; it only depends on the model classes."""
+    return AppConfig.model_json_schema()
+
+
 def get_config_schema() -> Dict[str, Any]:
     """
     Get the JSON schema for the configuration model.
     
+    Returns a copy of the cached schema, so callers may modify it freely.
+    
     Returns:
         JSON schema dictionary that can be used for validation or documentation
     """
-    return AppConfig.model_json_schema()
\ No newline at end of file
+    return copy.deepcopy(_build_config_schema())
\ No newline at end of file
@@ -9,14 +9,38 @@ operations across multiple interconnected tables including beneficiaries, compla
 complaint_notes, and classification_keys. The class ensures data integrity through
 proper foreign key constraints and supports comprehensive complaint tracking with
 follow-up notes and user activity monitoring.
+
+The database runs in WAL mode: writes go through a single primary connection, while
+SELECT queries are served by a small pool of long-lived reader connections so that
+concurrent reads no longer serialize behind the primary connection's lock.
 """
 
 import sqlite3
+import asyncio
 import logging
 import threading
+import queue
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Iterator, Callable, TypeVar, Any
+
+
+# Per-connection prepared-statement cache size (sqlite3 default is 128)
+CACHED_STATEMENTS = 256
+
+# Per-connection settings applied to the primary and every reader connection.
+# synchronous=NORMAL is safe in WAL mode (a power loss can only drop the last
+# commits, never corrupt the database) and avoids an fsync on every commit.
+CONNECTION_PRAGMAS = (
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -64000",  # 64 MB page cache
+)
+
+T = TypeVar('T')
 
 
 class DatabaseManager:
@@ -29,17 +53,27 @@ class DatabaseManager:
     relationships and data integrity constraints.
     """
     
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, read_pool_size: int = 4):
         """
         Initialize the DatabaseManager with the specified database path.
         
         Args:
             db_path (str): Full path to the SQLite database file
+            read_pool_size (int): Number of long-lived reader connections used for
+                SELECT queries (0 disables the pool and reads use the primary connection)
         """
         self.db_path = db_path
         self.conn: Optional[sqlite3.Connection] = None
         self.cursor: Optional[sqlite3.Cursor] = None
         self._lock = threading.RLock()
+        self.read_pool_size = max(0, read_pool_size)
+        self._read_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._read_connections: List[sqlite3.Connection] = []
+        self.executor: Optional[ThreadPoolExecutor] = None
+        
+        # Serializes async writers before they take an executor thread, so waiting
+        # writers don't occupy the threads the readers need
+        self.write_lock = asyncio.Lock()
         
         # Ensure the database file's directory exists
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
@@ -52,21 +86,49 @@ class DatabaseManager:
         Establish a connection to the SQLite database.
         
         Creates the database connection and cursor objects. Enables foreign key
-        constraints for proper referential integrity. Handles potential exceptions
-        during connection establishment.
+        constraints for proper referential integrity and switches the database to
+        WAL mode so the reader pool can run alongside the writer. Handles potential
+        exceptions during connection establishment.
         
         Raises:
             sqlite3.Error: If database connection fails
         """
         try:
-            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.conn = sqlite3.connect(
+                self.db_path, check_same_thread=False, cached_statements=CACHED_STATEMENTS
+            )
             self.cursor = self.conn.cursor()
             
             # Enable foreign key constraints
             self.cursor.execute("PRAGMA foreign_keys = ON")
+            
+            # WAL lets readers proceed concurrently with the single writer
+            self.cursor.execute("PRAGMA journal_mode = WAL")
+            for pragma in CONNECTION_PRAGMAS:
+                self.cursor.execute(pragma)
             self.conn.commit()
             
-            self.logger.info(f"Successfully connected to database: {self.db_path}")
+            # Open the long-lived reader connections
+            for _ in range(self.read_pool_size):
+                reader = sqlite3.connect(
+                    self.db_path, check_same_thread=False, cached_statements=CACHED_STATEMENTS
+                )
+                reader.execute("PRAGMA query_only = ON")
+                for pragma in CONNECTION_PRAGMAS:
+                    reader.execute(pragma)
+                self._read_connections.append(reader)
+                self._read_pool.put(reader)
+            
+            # Dedicated worker threads for async callers: one per reader plus one for
+            # the writer, so database calls never queue behind unrelated executor work
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.read_pool_size + 1, thread_name_prefix="db"
+            )
+            
+            self.logger.info(
+                f"Successfully connected to database: {self.db_path} "
+                f"({self.read_pool_size} reader connections)"
+            )
         except sqlite3.Error as e:
             self.logger.error(f"Failed to connect to database {self.db_path}: {e}")
             raise
@@ -76,8 +138,14 @@ class DatabaseManager:
         Close the database connection and reset connection objects.
         
         Safely closes the database connection and sets connection objects to None.
+        Waits for calls already submitted to the executor before closing.
         """
         try:
+            if self.executor:
+                self.executor.shutdown(wait=True)
+                self.executor = None
+            for reader in self._read_connections:
+                reader.close()
             if self.conn:
                 self.conn.close()
                 self.logger.info("Database connection closed successfully")
@@ -86,13 +154,38 @@ class DatabaseManager:
         finally:
             self.conn = None
             self.cursor = None
+            self._read_connections = []
+            self._read_pool = queue.Queue()
+    
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a reader connection from the pool for the duration of a SELECT.
+        
+        Falls back to the primary connection (under the write lock) when the
+        pool is disabled.
+        
+        Yields:
+            sqlite3.Connection: Connection to run the read query on
+        """
+        if not self._read_connections:
+            with self._lock:
+                yield self.conn
+            return
+        
+        reader = self._read_pool.get()
+        try:
+            yield reader
+        finally:
+            self._read_pool.put(reader)
     
     def create_tables(self) -> None:
         """
         Create all required tables if they don't exist and initialize default data.
         
         Creates the beneficiaries, complaints, complaint_notes, and classification_keys
-        tables with proper foreign key relationships. Also populates classification_keys
+        tables with proper foreign key relationships, plus the trigger-maintained
+        complaint_stats counters. Also populates classification_keys
         with default data if the table is empty. All table creation is executed within
         a single transaction to ensure atomicity.
         
@@ -190,6 +283,75 @@ class DatabaseManager:
                     )
                 """)
                 
+                # Index for per-user complaint history: beneficiaries.user_telegram_id is
+                # already indexed by its UNIQUE constraint; this serves the join and the
+                # newest-first ordering without a sort
+                self.cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_comp_ben_sub
+                    ON complaints (beneficiary_id, submitted_at DESC)
+                """)
+                
+                # Per-status complaint counters kept current by triggers, so statistics
+                # don't need to scan the complaints table
+                stats_table_exists = self.cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'complaint_stats'"
+                ).fetchone() is not None
+                
+                self.cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS complaint_stats (
+                        status TEXT PRIMARY KEY,
+                        complaint_count INTEGER NOT NULL DEFAULT 0,
+                        critical_count INTEGER NOT NULL DEFAULT 0
+                    )
+                """)
+                
+                if not stats_table_exists:
+                    # Backfill the counters from complaints logged before the table existed
+                    self.cursor.execute("""
+                        INSERT INTO complaint_stats (status, complaint_count, critical_count)
+                        SELECT status, COUNT(*), SUM(is_critical = 1)
+                        FROM complaints GROUP BY status
+                    """)
+                
+                self.cursor.execute("""
+                    CREATE TRIGGER IF NOT EXISTS trg_complaint_stats_insert
+                    AFTER INSERT ON complaints
+                    BEGIN
+                        INSERT INTO complaint_stats (status, complaint_count, critical_count)
+                        VALUES (NEW.status, 1, NEW.is_critical = 1)
+                        ON CONFLICT(status) DO UPDATE SET
+                            complaint_count = complaint_count + 1,
+                            critical_count = critical_count + excluded.critical_count;
+                    END
+                """)
+                
+                self.cursor.execute("""
+                    CREATE TRIGGER IF NOT EXISTS trg_complaint_stats_update
+                    AFTER UPDATE OF status, is_critical ON complaints
+                    BEGIN
+                        UPDATE complaint_stats SET
+                            complaint_count = complaint_count - 1,
+                            critical_count = critical_count - (OLD.is_critical = 1)
+                        WHERE status = OLD.status;
+                        INSERT INTO complaint_stats (status, complaint_count, critical_count)
+                        VALUES (NEW.status, 1, NEW.is_critical = 1)
+                        ON CONFLICT(status) DO UPDATE SET
+                            complaint_count = complaint_count + 1,
+                            critical_count = critical_count + excluded.critical_count;
+                    END
+                """)
+                
+                self.cursor.execute("""
+                    CREATE TRIGGER IF NOT EXISTS trg_complaint_stats_delete
+                    AFTER DELETE ON complaints
+                    BEGIN
+                        UPDATE complaint_stats SET
+                            complaint_count = complaint_count - 1,
+                            critical_count = critical_count - (OLD.is_critical = 1)
+                        WHERE status = OLD.status;
+                    END
+                """)
+                
                 self.conn.commit()
                 self.logger.info("All tables created successfully")
                 
@@ -261,7 +423,7 @@ class DatabaseManager:
             self.logger.error(f"Error initializing default classification keys: {e}")
             raise
     
-    def execute_query(self, query: str, params: Tuple = ()) -> None:
+    def execute_query(self, query: str, params: Tuple = ()) -> Optional[int]:
         """
         Execute a SQL query that modifies data (INSERT, UPDATE, DELETE).
         
@@ -269,6 +431,9 @@ class DatabaseManager:
             query (str): SQL query string
             params (Tuple): Query parameters for parameterized queries
             
+        Returns:
+            Optional[int]: Row ID of the last inserted row on the primary connection
+            
         Raises:
             sqlite3.Error: If query execution fails
         """
@@ -280,12 +445,46 @@ class DatabaseManager:
                 self.cursor.execute(query, params)
                 self.conn.commit()
                 self.logger.debug(f"Query executed successfully: {query[:50]}...")
+                return self.cursor.lastrowid
         except sqlite3.Error as e:
             self.logger.error(f"Error executing query: {e}")
             if self.conn:
                 self.conn.rollback()
             raise
     
+    def run_in_transaction(self, operation: Callable[..., T], *args: Any) -> T:
+        """
+        Run several writes on the primary connection as a single transaction.
+        
+        Calls operation(cursor, *args) between BEGIN IMMEDIATE and COMMIT, so the
+        writes it performs are committed (and synced to disk) once. Any exception
+        rolls the whole transaction back.
+        
+        Args:
+            operation: Callable receiving the primary cursor followed by *args
+            *args: Additional positional arguments for operation
+            
+        Returns:
+            Whatever operation returns
+            
+        Raises:
+            sqlite3.Error: If any statement in the transaction fails
+        """
+        if not self.conn:
+            raise sqlite3.Error("Database connection not established. Call connect() first.")
+        
+        with self._lock:
+            try:
+                self.cursor.execute("BEGIN IMMEDIATE")
+                result = operation(self.cursor, *args)
+                self.conn.commit()
+                self.logger.debug("Transaction committed successfully")
+                return result
+            except BaseException as e:
+                self.logger.error(f"Error in transaction, rolling back: {e}")
+                self.conn.rollback()
+                raise
+    
     def fetch_one(self, query: str, params: Tuple = ()) -> Optional[Tuple]:
         """
         Execute a SELECT query expected to return a single row.
@@ -304,9 +503,11 @@ class DatabaseManager:
             raise sqlite3.Error("Database connection not established. Call connect() first.")
         
         try:
-            with self._lock:
-                self.cursor.execute(query, params)
-                result = self.cursor.fetchone()
+            with self._reader() as conn:
+                cursor = conn.execute(query, params)
+                result = cursor.fetchone()
+                # Reset the statement so the reader doesn't hold a stale snapshot
+                cursor.close()
                 self.logger.debug(f"Fetch one query executed: {query[:50]}...")
                 return result
         except sqlite3.Error as e:
@@ -331,9 +532,8 @@ class DatabaseManager:
             raise sqlite3.Error("Database connection not established. Call connect() first.")
         
         try:
-            with self._lock:
-                self.cursor.execute(query, params)
-                results = self.cursor.fetchall()
+            with self._reader() as conn:
+                results = conn.execute(query, params).fetchall()
                 self.logger.debug(f"Fetch all query executed: {query[:50]}...")
                 return results
         except sqlite3.Error as e:
@@ -98,6 +98,9 @@ class PromptBuilder:
         # Validate templates after loading
         self._validate_all_templates()
         
+        # Classification context shared by every final analysis prompt
+        self.refresh_classification_context()
+        
         logger.info("Institution PromptBuilder initialized successfully with multi-prompt architecture")
 
     def _validate_placeholder_replacement(self, template: str, variables: dict) -> bool:
@@ -225,6 +228,23 @@ Institution: {variables.get('institution_name', 'N/A')}
 Please review template configuration.
 """
 
+    def refresh_classification_context(self) -> None:
+        """
+        Rebuild the cached classification context used by the final analysis prompt.
+        
+        The allowed categories, sectors, sensitivities and critical keywords only
+        change with the configuration, so their prompt text is rendered once here
+        instead of on every complaint. Call again after reloading the configuration.
+        """
+        self._classification_context = {
+            'allowed_categories': self._get_allowed_categories_text(),
+            'category_guidance': self._get_category_guidance_text(),
+            'allowed_sensitivities': self._get_allowed_sensitivities_text(),
+            'critical_keywords': self._get_critical_keywords_text(),
+            'allowed_sectors': self._get_allowed_sectors_text(),
+            'sector_guidance': self._get_sector_guidance_text()
+        }
+
     def _get_allowed_categories_text(self) -> str:
         """Get allowed categories text with fallback."""
         complaint_categories = getattr(self.analysis_settings, 'complaint_categories', [])
@@ -442,7 +462,7 @@ Please replace with actual template content."""
                 'institution_name': institution_name,
                 'user_first_name': user_first_name or "User",
                 'current_date_time': current_date_time or datetime.now().isoformat(),
-                'critical_keywords': self._get_critical_keywords_text(),
+                'critical_keywords': self._classification_context['critical_keywords'],
                 'language_instruction': self.language_instructions.get(language, self.language_instructions['ar'])
             }
             
@@ -479,8 +499,8 @@ Please replace with actual template content."""
         Generate a specialized system prompt for final complaint analysis.
         
         This method creates a comprehensive system prompt for final analysis by populating
-        the final_analysis_prompt.txt template with complaint text and dynamic configuration
-        data including allowed categories, category guidance, sensitivity levels, and critical keywords.
+        the final_analysis_prompt.txt template with complaint text and the cached configuration
+        context (allowed categories, category guidance, sensitivity levels, and critical keywords).
         
         Args:
             complaint_text: The complaint text to be analyzed
@@ -494,12 +514,7 @@ Please replace with actual template content."""
         try:
             template_variables = {
                 'complaint_text': complaint_text or "No complaint text provided",
-                'allowed_categories': self._get_allowed_categories_text(),
-                'category_guidance': self._get_category_guidance_text(),
-                'allowed_sensitivities': self._get_allowed_sensitivities_text(),
-                'critical_keywords': self._get_critical_keywords_text(),
-                'allowed_sectors': self._get_allowed_sectors_text(),
-                'sector_guidance': self._get_sector_guidance_text()
+                **self._classification_context
             }
             
             formatted_prompt = self._safe_format_template(
@@ -42,7 +42,11 @@ from pathlib import Path
 from typing import Optional
 
 import yaml
-from yaml.loader import SafeLoader
+try:
+    # libyaml-backed loader, several times faster when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml.loader import SafeLoader
 from telegram.ext import PicklePersistence, PersistenceInput  # Updated import for v20+ API
 from dotenv import load_dotenv
 import pydantic
@@ -88,8 +92,10 @@ def setup_logging(config: AppConfig) -> None:
     # Configure logging level using attribute access
     log_level = getattr(logging, logging_config.level.upper())
     
-    # Configure logging format using attribute access
+    # Configure logging format using attribute access; one formatter is
+    # shared by all handlers
     log_format = logging_config.format
+    formatter = logging.Formatter(log_format)
     
     # Setup handlers
     handlers = []
@@ -102,13 +108,13 @@ def setup_logging(config: AppConfig) -> None:
             maxBytes=logging_config.max_file_size_mb * 1024 * 1024,
             backupCount=logging_config.backup_count
         )
-        file_handler.setFormatter(logging.Formatter(log_format))
+        file_handler.setFormatter(formatter)
         handlers.append(file_handler)
     
     # Console handler
     if logging_config.console_output:
         console_handler = logging.StreamHandler()
-        console_handler.setFormatter(logging.Formatter(log_format))
+        console_handler.setFormatter(formatter)
         handlers.append(console_handler)
     
     # Configure root logger
@@ -149,7 +155,8 @@ def load_configuration() -> AppConfig:
             sys.exit(1)
         
         # Load YAML data
-        with open(config_path, 'r', encoding='utf-8') as config_file:
+        # Read raw bytes so the loader decodes the UTF-8 stream itself
+        with open(config_path, 'rb') as config_file:
             yaml_data = yaml.load(config_file, Loader=SafeLoader)
             
         if not yaml_data:
@@ -205,7 +212,10 @@ async def initialize_database_manager(config: AppConfig) -> DatabaseManager:
         
         logging.info(f"Initializing DatabaseManager with path: {db_path}")
         
-        database_manager = DatabaseManager(db_path=str(db_path))
+        database_manager = DatabaseManager(
+            db_path=str(db_path),
+            read_pool_size=db_config.get('read_pool_size', 4)
+        )
         await asyncio.to_thread(database_manager.connect)
         await asyncio.to_thread(database_manager.create_tables)
         
@@ -0,0 +1,81 @@
+"""Tests for complaint logging in InstitutionBot."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import yaml
+
+from app.bot.institution_bot_logic import InstitutionBot
+from app.config.config_model import AppConfig, ComplaintData
+from app.core.ai_handler import AIHandler
+from app.core.database_manager import DatabaseManager
+from app.core.prompt_builder import PromptBuilder
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "app" / "config" / "config.yaml"
+
+
+@pytest.fixture
+def config(monkeypatch):
+    for name in ("TELEGRAM_BOT_TOKEN", "OPENROUTER_API_KEY", "HF_API_TOKEN"):
+        monkeypatch.setenv(name, "test")
+    with open(CONFIG_PATH, encoding="utf-8") as config_file:
+        return AppConfig(**yaml.safe_load(config_file))
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "complaints.db"))
+    manager.connect()
+    manager.create_tables()
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def bot(config, db_manager):
+    bot = InstitutionBot(
+        config,
+        MagicMock(spec=AIHandler),
+        None,
+        MagicMock(spec=PromptBuilder),
+        "test",
+        db_manager
+    )
+    bot.perform_final_complaint_analysis = AsyncMock(return_value={
+        'summary': 'Test complaint',
+        'complaint_type': 'User Complaint',
+        'complaint_category': 'General',
+        'sensitivity': 'Normal',
+        'is_critical': False
+    })
+    return bot
+
+
+def test_concurrent_complaints_for_new_user_are_both_logged(bot, db_manager):
+    """Two complaints submitted at once by a user with no beneficiary row are both stored."""
+    complaints = [
+        ComplaintData(user_id=4242, name="Test User", phone="777123456",
+                      original_complaint_text=text)
+        for text in ("first complaint", "second complaint")
+    ]
+
+    async def submit_both():
+        return await asyncio.gather(*(bot._log_complaint(data) for data in complaints))
+
+    reference_ids = asyncio.run(submit_both())
+
+    assert all(reference_ids)
+    assert reference_ids[0] != reference_ids[1]
+
+    beneficiaries = db_manager.fetch_all(
+        "SELECT id FROM beneficiaries WHERE user_telegram_id = ?", (4242,)
+    )
+    assert len(beneficiaries) == 1
+
+    complaint_rows = db_manager.fetch_all(
+        "SELECT reference_id, beneficiary_id FROM complaints ORDER BY id"
+    )
+    assert sorted(row[0] for row in complaint_rows) == sorted(reference_ids)
+    assert {row[1] for row in complaint_rows} == {beneficiaries[0][0]}